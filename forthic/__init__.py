@@ -37,6 +37,7 @@ from .module import (
     ModuleMemoWord,
     PushValueWord,
     Stack,
+    SyncWordHandler,
     Variable,
     Word,
     WordHandler,
@@ -74,6 +75,7 @@ __all__ = [
     "Variable",
     "Stack",
     "WordHandler",
+    "SyncWordHandler",
     # Tokenizer
     "Tokenizer",
     "Token",
@@ -6,6 +6,7 @@ stack marshalling and documentation support.
 
 from __future__ import annotations
 
+import inspect
 import re
 import weakref
 from collections.abc import Callable
@@ -13,6 +14,8 @@ from dataclasses import dataclass
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from ..word_options import WordOptions
+
 if TYPE_CHECKING:
     from ..interpreter import Interpreter
 
@@ -193,35 +196,46 @@ def ForthicWord(
             has_options=has_options,
         )
 
-        # Replace method with wrapper that handles stack marshalling
-        @wraps(method)
-        async def wrapper(self: Any, interp: Interpreter) -> None:
-            from ..word_options import WordOptions
-
-            inputs: list[Any] = []
-
+        def pop_inputs(interp: Interpreter) -> list[Any]:
             # Check for optional WordOptions FIRST (before popping regular args)
             options: dict[str, Any] | None = None
             if has_options and len(interp.get_stack()) > 0:
                 top = interp.stack_peek()
                 if isinstance(top, WordOptions):
-                    opts = interp.stack_pop()
-                    options = opts.to_dict()
+                    options = interp.stack_pop().to_dict()
 
-            # Pop required inputs in reverse order (stack is LIFO)
-            for _ in range(input_count):
-                inputs.insert(0, interp.stack_pop())
+            # Pop required inputs, already in call order
+            inputs = interp.stack_popn(input_count)
 
             # Add options as last parameter if method expects it
             if has_options:
                 inputs.append(options or {})
+            return inputs
+
+        # Replace method with wrapper that handles stack marshalling.
+        # Plain (non-async) methods get a plain wrapper so they can run without
+        # coroutine overhead (see ModuleWord.execute_sync).
+        wrapper: Callable
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def wrapper(self: Any, interp: Interpreter) -> None:
+                # Call original method with popped inputs (+ options if present)
+                result = await method(self, *pop_inputs(interp))
+
+                # Push result if not None
+                if result is not None:
+                    interp.stack_push(result)
 
-            # Call original method with popped inputs (+ options if present)
-            result = await method(self, *inputs)
+        else:
 
-            # Push result if not None
-            if result is not None:
-                interp.stack_push(result)
+            @wraps(method)
+            def wrapper(self: Any, interp: Interpreter) -> None:
+                result = method(self, *pop_inputs(interp))
+                if result is not None:
+                    interp.stack_push(result)
+
+            wrapper._forthic_sync = True  # type: ignore
 
         # Attach metadata to wrapper for later retrieval
         wrapper._forthic_word_metadata = metadata  # type: ignore
@@ -263,10 +277,21 @@ def ForthicDirectWord(
             method_name=method.__name__,
         )
 
-        # Wrap to ensure metadata storage
-        @wraps(method)
-        async def wrapper(self: Any, interp: Interpreter) -> None:
-            return await method(self, interp)
+        # Wrap to ensure metadata storage (plain methods stay plain)
+        wrapper: Callable
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def wrapper(self: Any, interp: Interpreter) -> None:
+                await method(self, interp)
+
+        else:
+
+            @wraps(method)
+            def wrapper(self: Any, interp: Interpreter) -> None:
+                method(self, interp)
+
+            wrapper._forthic_sync = True  # type: ignore
 
         # Attach metadata to wrapper for later retrieval
         wrapper._forthic_direct_word_metadata = metadata  # type: ignore
@@ -345,12 +370,12 @@ class DecoratedModule:
             # Check if this is a @ForthicWord decorated method
             if callable(attr) and hasattr(attr, "_forthic_word_metadata"):
                 metadata = attr._forthic_word_metadata
-                _word_metadata[cls][metadata.method_name] = metadata
+                _word_metadata[cls][attr_name] = metadata
 
             # Check if this is a @ForthicDirectWord decorated method
             elif callable(attr) and hasattr(attr, "_forthic_direct_word_metadata"):
                 metadata = attr._forthic_direct_word_metadata
-                _direct_word_metadata[cls][metadata.method_name] = metadata
+                _direct_word_metadata[cls][attr_name] = metadata
 
     def _register_decorated_words(self) -> None:
         """Register all decorated words with the module."""
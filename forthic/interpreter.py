@@ -5,8 +5,10 @@ Core interpreter that tokenizes and executes Forthic code.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from datetime import timezone as dt_timezone
+from time import perf_counter_ns
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -41,6 +43,20 @@ from .tokenizer import CodeLocation, PositionedString, Token, Tokenizer, TokenTy
 # Type alias for error handlers
 HandleErrorFunction = Callable[[Exception, "Interpreter"], Coroutine[Any, Any, None]]
 
+# Token types bound at module level so token dispatch avoids enum attribute lookups
+_TT_STRING = TokenType.STRING
+_TT_COMMENT = TokenType.COMMENT
+_TT_START_ARRAY = TokenType.START_ARRAY
+_TT_END_ARRAY = TokenType.END_ARRAY
+_TT_START_MODULE = TokenType.START_MODULE
+_TT_END_MODULE = TokenType.END_MODULE
+_TT_START_DEF = TokenType.START_DEF
+_TT_END_DEF = TokenType.END_DEF
+_TT_START_MEMO = TokenType.START_MEMO
+_TT_WORD = TokenType.WORD
+_TT_DOT_SYMBOL = TokenType.DOT_SYMBOL
+_TT_EOS = TokenType.EOS
+
 
 # -------------------------------------
 # Special Words for Interpreter
@@ -53,11 +69,13 @@ class StartModuleWord(Word):
     Empty name refers to the app module.
     """
 
-    async def execute(self, interp: Interpreter) -> None:
+    __slots__ = ()
+
+    def execute_sync(self, interp: Interpreter) -> bool:
         # The app module is the only module with a blank name
         if self.name == "":
             interp.module_stack_push(interp.get_app_module())
-            return
+            return True
 
         # If the module is used by the current module, push it, otherwise create new
         module = interp.cur_module().find_module(self.name)
@@ -69,16 +87,26 @@ class StartModuleWord(Word):
             if interp.cur_module().name == "":
                 interp.register_module(module)
         interp.module_stack_push(module)
+        return True
+
+    async def execute(self, interp: Interpreter) -> None:
+        self.execute_sync(interp)
 
 
 class EndModuleWord(Word):
     """Pops the current module from the module stack."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("}")
 
-    async def execute(self, interp: Interpreter) -> None:
+    def execute_sync(self, interp: Interpreter) -> bool:
         interp.module_stack_pop()
+        return True
+
+    async def execute(self, interp: Interpreter) -> None:
+        self.execute_sync(interp)
 
 
 class EndArrayWord(Word):
@@ -88,18 +116,35 @@ class EndArrayWord(Word):
     then pushes them as a single array in the correct order.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("]")
 
-    async def execute(self, interp: Interpreter) -> None:
-        items: list[Any] = []
-        while True:
-            item = interp.stack_pop()
-            if isinstance(item, Token) and item.type == TokenType.START_ARRAY:
+    def execute_sync(self, interp: Interpreter) -> bool:
+        # Find the START_ARRAY marker, then take everything above it in one slice,
+        # unwrapping PositionedStrings as we go
+        stack = interp.get_stack()
+        for start in range(len(stack) - 1, -1, -1):
+            item = stack[start]
+            if isinstance(item, Token) and item.type is _TT_START_ARRAY:
                 break
-            items.append(item)
-        items.reverse()
-        interp.stack_push(items)
+        else:
+            # No marker: consume the stack and report the underflow
+            stack.clear()
+            interp.stack_pop()
+
+        items = [
+            item.string if type(item) is PositionedString else item
+            for item in stack[start + 1 :]
+        ]
+        del stack[start:]
+        interp._string_location = None
+        stack.append(items)
+        return True
+
+    async def execute(self, interp: Interpreter) -> None:
+        self.execute_sync(interp)
 
 
 # -------------------------------------
@@ -131,14 +176,16 @@ class Interpreter:
         self._is_compiling = False
         self._is_memo_definition = False
         self._cur_definition: DefinitionWord | None = None
+        # Swapped between execute/compile handlers when compilation starts/ends
+        self._handle_word_impl = self._handle_word_execute
 
         # Debug support
         self._string_location: CodeLocation | None = None
 
         # Profiling support
-        self._word_counts: dict[str, int] = {}
+        self._word_counts: defaultdict[str, int] = defaultdict(int)
         self._is_profiling = False
-        self._timestamps: list[dict[str, Any]] = []
+        self._timestamps: list[tuple[str, int]] = []
 
         # Literal handlers
         self._literal_handlers: list[LiteralHandler] = []
@@ -191,6 +238,7 @@ class Interpreter:
         self._is_compiling = False
         self._is_memo_definition = False
         self._cur_definition = None
+        self._handle_word_impl = self._handle_word_execute
         self._string_location = None
 
     # ======================
@@ -210,21 +258,26 @@ class Interpreter:
         self._tokenizer_stack.pop()
         return True
 
-    async def _execute_with_recovery(self, num_attempts: int = 0) -> int:
-        """Execute with error recovery."""
-        try:
+    async def _execute_with_recovery(self) -> int:
+        """Execute with error recovery.
+
+        Retries run in a loop (not recursion) so each attempt runs at the same
+        stack depth.
+        """
+        num_attempts = 0
+        while True:
             num_attempts += 1
             if num_attempts > self._max_attempts:
                 raise TooManyAttemptsError(
                     self.get_top_input_string(), num_attempts, self._max_attempts
                 )
-            await self._continue()
-            return num_attempts
-        except Exception as e:
-            if not self._handle_error:
-                raise
-            await self._handle_error(e, self)
-            return await self._execute_with_recovery(num_attempts)
+            try:
+                await self._continue()
+                return num_attempts
+            except Exception as e:
+                if not self._handle_error:
+                    raise
+                await self._handle_error(e, self)
 
     async def _continue(self) -> None:
         """Continue execution with current tokenizer."""
@@ -236,7 +289,7 @@ class Interpreter:
             token = tokenizer.next_token()
             self._previous_token = token
             await self._handle_token(token)
-            if token.type == TokenType.EOS:
+            if token.type is _TT_EOS:
                 break
         return True
 
@@ -319,34 +372,57 @@ class Interpreter:
 
     def stack_peek(self) -> Any:
         """Peek at top of stack."""
-        top = self._stack[len(self._stack) - 1]
-        result = top
-        if isinstance(top, PositionedString):
-            result = str(top)
-        return result
+        top = self._stack[-1]
+        if type(top) is PositionedString:
+            return top.string
+        return top
 
     def stack_push(self, val: Any) -> None:
         """Push value onto stack."""
-        self._stack.push(val)
+        self._stack.append(val)
+
+    def _stack_underflow_error(self) -> StackUnderflowError:
+        tokenizer = self.get_tokenizer() if self._tokenizer_stack else None
+        location = tokenizer.get_token_location() if tokenizer else None
+        return StackUnderflowError(self.get_top_input_string(), location)
 
     def stack_pop(self) -> Any:
         """Pop value from stack."""
         if len(self._stack) == 0:
-            tokenizer = self.get_tokenizer() if self._tokenizer_stack else None
-            location = tokenizer.get_token_location() if tokenizer else None
-            raise StackUnderflowError(self.get_top_input_string(), location)
+            raise self._stack_underflow_error()
 
         result = self._stack.pop()
 
         # If we have a PositionedString, record the location
-        self._string_location = None
-        if isinstance(result, PositionedString):
-            positioned_string = result
-            result = str(positioned_string)
-            self._string_location = positioned_string.location
+        # (exact type check: PositionedString is never subclassed)
+        if type(result) is PositionedString:
+            self._string_location = result.location
+            return result.string
 
+        self._string_location = None
         return result
 
+    def stack_popn(self, n: int) -> list[Any]:
+        """Pop the top n values in one step, returned in stack order (deepest first).
+
+        Equivalent to n stack_pop() calls (reversed), except that nothing is popped
+        if the stack holds fewer than n items.
+        """
+        stack = self._stack
+        start = len(stack) - n
+        if start < 0:
+            raise self._stack_underflow_error()
+        if n == 0:
+            return []
+
+        items = stack[start:]
+        del stack[start:]
+
+        # As with stack_pop, the string location is that of the last item popped
+        first = items[0]
+        self._string_location = first.location if type(first) is PositionedString else None
+        return [item.string if type(item) is PositionedString else item for item in items]
+
     def get_stack(self) -> Stack:
         """Get the stack object."""
         return self._stack
@@ -419,17 +495,14 @@ class Interpreter:
     def start_profiling(self) -> None:
         """Start profiling word execution."""
         self._is_profiling = True
-        self._word_counts = {}
+        self._word_counts = defaultdict(int)
         self._timestamps = []
 
     def count_word(self, word: Word) -> None:
         """Count word execution (for profiling)."""
         if not self._is_profiling:
             return
-        name = word.name
-        if name not in self._word_counts:
-            self._word_counts[name] = 0
-        self._word_counts[name] += 1
+        self._word_counts[word.name] += 1
 
     def stop_profiling(self) -> None:
         """Stop profiling."""
@@ -442,43 +515,47 @@ class Interpreter:
 
     def add_timestamp(self, label: str) -> None:
         """Add a profiling timestamp with label."""
-        import time
-
-        time_ms = time.time() * 1000
-        self._timestamps.append({"label": label, "time_ms": time_ms})
+        self._timestamps.append((label, perf_counter_ns()))
 
     def profile_timestamps(self) -> list[dict[str, Any]]:
-        """Get profiling timestamps."""
-        return self._timestamps
+        """Get profiling timestamps.
+
+        Times are monotonic (perf_counter) milliseconds, suitable for deltas.
+        """
+        return [
+            {"label": label, "time_ms": time_ns / 1_000_000}
+            for label, time_ns in self._timestamps
+        ]
 
     # ======================
     # Token handling
 
     async def _handle_token(self, token: Token) -> None:
         """Handle a single token."""
-        if token.type == TokenType.STRING:
+        token_type = token.type
+        if token_type is _TT_STRING:
             await self._handle_string_token(token)
-        elif token.type == TokenType.COMMENT:
+        elif token_type is _TT_COMMENT:
             self._handle_comment_token(token)
-        elif token.type == TokenType.START_ARRAY:
+        elif token_type is _TT_START_ARRAY:
             await self._handle_start_array_token(token)
-        elif token.type == TokenType.END_ARRAY:
+        elif token_type is _TT_END_ARRAY:
             await self._handle_end_array_token(token)
-        elif token.type == TokenType.START_MODULE:
+        elif token_type is _TT_START_MODULE:
             await self._handle_start_module_token(token)
-        elif token.type == TokenType.END_MODULE:
+        elif token_type is _TT_END_MODULE:
             await self._handle_end_module_token(token)
-        elif token.type == TokenType.START_DEF:
+        elif token_type is _TT_START_DEF:
             self._handle_start_definition_token(token)
-        elif token.type == TokenType.START_MEMO:
+        elif token_type is _TT_START_MEMO:
             self._handle_start_memo_token(token)
-        elif token.type == TokenType.END_DEF:
+        elif token_type is _TT_END_DEF:
             self._handle_end_definition_token(token)
-        elif token.type == TokenType.DOT_SYMBOL:
+        elif token_type is _TT_DOT_SYMBOL:
             await self._handle_dot_symbol_token(token)
-        elif token.type == TokenType.WORD:
+        elif token_type is _TT_WORD:
             await self._handle_word_token(token)
-        elif token.type == TokenType.EOS:
+        elif token_type is _TT_EOS:
             if self._is_compiling:
                 location = self._previous_token.location if self._previous_token else None
                 raise MissingSemicolonError(self.get_top_input_string(), location)
@@ -489,11 +566,11 @@ class Interpreter:
 
     async def _handle_string_token(self, token: Token) -> None:
         value = PositionedString(token.string, token.location)
-        await self._handle_word(PushValueWord("<string>", value))
+        await self._handle_word_impl(PushValueWord("<string>", value))
 
     async def _handle_dot_symbol_token(self, token: Token) -> None:
         value = PositionedString(token.string, token.location)
-        await self._handle_word(PushValueWord("<dot-symbol>", value))
+        await self._handle_word_impl(PushValueWord("<dot-symbol>", value))
 
     async def _handle_start_module_token(self, token: Token) -> None:
         """Start/end module tokens are IMMEDIATE and also compiled."""
@@ -501,20 +578,22 @@ class Interpreter:
         if self._is_compiling and self._cur_definition:
             self._cur_definition.add_word(word)
         self.count_word(word)
-        await word.execute(self)
+        if not word.execute_sync(self):
+            await word.execute(self)
 
     async def _handle_end_module_token(self, token: Token) -> None:
         word = EndModuleWord()
         if self._is_compiling and self._cur_definition:
             self._cur_definition.add_word(word)
         self.count_word(word)
-        await word.execute(self)
+        if not word.execute_sync(self):
+            await word.execute(self)
 
     async def _handle_start_array_token(self, token: Token) -> None:
-        await self._handle_word(PushValueWord("<start_array_token>", token))
+        await self._handle_word_impl(PushValueWord("<start_array_token>", token))
 
     async def _handle_end_array_token(self, token: Token) -> None:
-        await self._handle_word(EndArrayWord())
+        await self._handle_word_impl(EndArrayWord())
 
     def _handle_comment_token(self, token: Token) -> None:
         """Comments are ignored."""
@@ -527,6 +606,7 @@ class Interpreter:
         self._cur_definition = DefinitionWord(token.string)
         self._is_compiling = True
         self._is_memo_definition = False
+        self._handle_word_impl = self._handle_word_compile
 
     def _handle_start_memo_token(self, token: Token) -> None:
         if self._is_compiling:
@@ -535,6 +615,7 @@ class Interpreter:
         self._cur_definition = DefinitionWord(token.string)
         self._is_compiling = True
         self._is_memo_definition = True
+        self._handle_word_impl = self._handle_word_compile
 
     def _handle_end_definition_token(self, token: Token) -> None:
         if not self._is_compiling or self._cur_definition is None:
@@ -545,22 +626,27 @@ class Interpreter:
         else:
             self.cur_module().add_word(self._cur_definition)
         self._is_compiling = False
+        self._handle_word_impl = self._handle_word_execute
 
     async def _handle_word_token(self, token: Token) -> None:
         word = self.find_word(token.string)
-        await self._handle_word(word, token.location)
+        await self._handle_word_impl(word, token.location)
 
-    async def _handle_word(
+    async def _handle_word_execute(
         self, word: Word, location: CodeLocation | None = None
     ) -> None:
-        """Handle a word (either compile or execute)."""
-        if self._is_compiling and self._cur_definition:
-            word.set_location(location)
-            self._cur_definition.add_word(word)
-        else:
-            self.count_word(word)
+        """Handle a word outside of a definition by executing it."""
+        self.count_word(word)
+        if not word.execute_sync(self):
             await word.execute(self)
 
+    async def _handle_word_compile(
+        self, word: Word, location: CodeLocation | None = None
+    ) -> None:
+        """Handle a word inside a definition by compiling it."""
+        word.set_location(location)
+        self._cur_definition.add_word(word)  # type: ignore[union-attr]
+
 
 def dup_interpreter(interp: Interpreter) -> Interpreter:
     """Create a duplicate of an interpreter.
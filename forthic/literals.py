@@ -12,6 +12,8 @@ from zoneinfo import ZoneInfo
 # Type alias for literal handlers
 LiteralHandler = Callable[[str], bool | int | float | str | date | time | datetime | None]
 
+_DATE_RE = re.compile(r"(\d{4}|YYYY)-(\d{2}|MM)-(\d{2}|DD)")
+
 
 def to_bool(s: str) -> bool | None:
     """Parse boolean literals: TRUE, FALSE."""
@@ -85,14 +87,22 @@ def to_literal_date(timezone: ZoneInfo) -> LiteralHandler:
     """
 
     def handler(s: str) -> date | None:
-        match = re.match(r"^(\d{4}|YYYY)-(\d{2}|MM)-(\d{2}|DD)$", s)
+        match = _DATE_RE.fullmatch(s)
         if not match:
             return None
 
-        now = datetime.now(timezone)
-        year = now.year if match.group(1) == "YYYY" else int(match.group(1))
-        month = now.month if match.group(2) == "MM" else int(match.group(2))
-        day = now.day if match.group(3) == "DD" else int(match.group(3))
+        year_str, month_str, day_str = match.groups()
+
+        # Only consult the clock when a wildcard is present
+        if year_str == "YYYY" or month_str == "MM" or day_str == "DD":
+            now = datetime.now(timezone)
+            year = now.year if year_str == "YYYY" else int(year_str)
+            month = now.month if month_str == "MM" else int(month_str)
+            day = now.day if day_str == "DD" else int(day_str)
+        else:
+            year = int(year_str)
+            month = int(month_str)
+            day = int(day_str)
 
         try:
             return date(year, month, day)
@@ -5,9 +5,12 @@ Includes Word classes, Variable, Module, and Stack.
 
 from __future__ import annotations
 
+import inspect
+import sys
 from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
+from .errors import IntentionalStopError, WordExecutionError
 from .tokenizer import CodeLocation, PositionedString
 
 if TYPE_CHECKING:
@@ -16,6 +19,9 @@ if TYPE_CHECKING:
 # Type alias for word handlers
 WordHandler = Callable[["Interpreter"], Coroutine[Any, Any, None]]
 
+# Type alias for word handlers that never await
+SyncWordHandler = Callable[["Interpreter"], None]
+
 # Type alias for error handlers
 WordErrorHandler = Callable[[Exception, "Word", "Interpreter"], Coroutine[Any, Any, None]]
 
@@ -30,9 +36,13 @@ class Variable:
     Represents a variable that can store and retrieve values within a module scope.
     """
 
+    __slots__ = ("name", "value", "_push_word")
+
     def __init__(self, name: str, value: Any = None):
         self.name = name
         self.value = value
+        # Word that pushes this variable, created on first lookup (see Module.find_variable)
+        self._push_word: PushValueWord | None = None
 
     def get_name(self) -> str:
         return self.name
@@ -59,9 +69,12 @@ class Word:
     it performs an action (typically manipulating the stack or control flow).
     """
 
+    __slots__ = ("name", "string", "location", "error_handlers")
+
     def __init__(self, name: str):
-        self.name = name
-        self.string = name
+        # Interned so dictionary lookups against tokenizer names compare by identity
+        self.name = sys.intern(name)
+        self.string = self.name
         self.location: CodeLocation | None = None
         self.error_handlers: list[WordErrorHandler] = []
 
@@ -103,6 +116,15 @@ class Word:
                 continue  # Try next handler
         return False  # No handler succeeded
 
+    def execute_sync(self, interp: Interpreter) -> bool:
+        """Execute this word without awaiting, if possible.
+
+        Returns True if the word ran to completion, or False if nothing was done and
+        the caller must `await execute()` instead. Words whose work never awaits
+        override this to skip coroutine overhead on the hot path.
+        """
+        return False
+
     async def execute(self, interp: Interpreter) -> None:
         """Execute this word. Must be overridden by subclasses."""
         raise NotImplementedError("Must override Word.execute")
@@ -114,41 +136,88 @@ class PushValueWord(Word):
     Used for literals, variables, and constants.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, name: str, value: Any):
         super().__init__(name)
         self.value = value
 
+    def execute_sync(self, interp: Interpreter) -> bool:
+        interp.stack_push(self.value)
+        return True
+
     async def execute(self, interp: Interpreter) -> None:
         interp.stack_push(self.value)
 
 
+# Opcodes for DefinitionWord's pre-resolved body
+_OP_PUSH = 0  # arg: value to push
+_OP_WORD = 1  # arg: word to execute
+_OP_PUSH_MANY = 2  # arg: tuple of values to push
+
+
 class DefinitionWord(Word):
     """User-defined word composed of other words.
 
     Represents a word defined in Forthic code using `:`.
     Contains a sequence of words that are executed in order.
+
+    On first execution the words are flattened into (opcode, arg) pairs: literal
+    pushes become inline stack pushes (runs of them are pushed in one extend) and
+    ExecuteWord wrappers are resolved to their targets. `words` is kept as-is
+    for inspection and error locations.
     """
 
+    __slots__ = ("words", "_ops")
+
     def __init__(self, name: str):
         super().__init__(name)
         self.words: list[Word] = []
+        self._ops: list[tuple[int, Any, int]] | None = None
 
     def add_word(self, word: Word) -> None:
         self.words.append(word)
+        self._ops = None
+
+    def _compile_ops(self) -> list[tuple[int, Any, int]]:
+        """Compile `words` into (opcode, arg, index into words) triples."""
+        ops: list[tuple[int, Any, int]] = []
+        for index, word in enumerate(self.words):
+            target = word
+            while type(target) is ExecuteWord:
+                target = target.target_word
+            if type(target) is not PushValueWord:
+                ops.append((_OP_WORD, target, index))
+            elif ops and ops[-1][0] == _OP_PUSH:
+                ops[-1] = (_OP_PUSH_MANY, (ops[-1][1], target.value), ops[-1][2])
+            elif ops and ops[-1][0] == _OP_PUSH_MANY:
+                ops[-1] = (_OP_PUSH_MANY, ops[-1][1] + (target.value,), ops[-1][2])
+            else:
+                ops.append((_OP_PUSH, target.value, index))
+        return ops
 
     async def execute(self, interp: Interpreter) -> None:
-        from .errors import WordExecutionError
+        ops = self._ops
+        if ops is None:
+            ops = self._ops = self._compile_ops()
 
-        for word in self.words:
+        stack_push = interp.stack_push
+        for op, arg, index in ops:
             try:
-                await word.execute(interp)
+                if op == _OP_WORD:
+                    if not arg.execute_sync(interp):
+                        await arg.execute(interp)
+                elif op == _OP_PUSH:
+                    stack_push(arg)
+                else:
+                    interp.get_stack().extend(arg)
             except Exception as e:
                 tokenizer = interp.get_tokenizer()
                 raise WordExecutionError(
                     f"Error executing {self.name}",
                     e,
                     tokenizer.get_token_location(),  # Where the word was called
-                    word.get_location(),  # Where the word was defined
+                    self.words[index].get_location(),  # Where the word was defined
                 ) from e
 
 
@@ -160,6 +229,8 @@ class ModuleMemoWord(Word):
     Defined in Forthic using `@:`.
     """
 
+    __slots__ = ("word", "has_value", "value")
+
     def __init__(self, word: Word):
         super().__init__(word.name)
         self.word = word
@@ -168,10 +239,17 @@ class ModuleMemoWord(Word):
 
     async def refresh(self, interp: Interpreter) -> None:
         """Re-execute the word and update cached value."""
-        await self.word.execute(interp)
+        if not self.word.execute_sync(interp):
+            await self.word.execute(interp)
         self.value = interp.stack_pop()
         self.has_value = True
 
+    def execute_sync(self, interp: Interpreter) -> bool:
+        if not self.has_value:
+            return False
+        interp.stack_push(self.value)
+        return True
+
     async def execute(self, interp: Interpreter) -> None:
         if not self.has_value:
             await self.refresh(interp)
@@ -185,6 +263,8 @@ class ModuleMemoBangWord(Word):
     Named with a `!` suffix.
     """
 
+    __slots__ = ("memo_word",)
+
     def __init__(self, memo_word: ModuleMemoWord):
         super().__init__(f"{memo_word.name}!")
         self.memo_word = memo_word
@@ -200,6 +280,8 @@ class ModuleMemoBangAtWord(Word):
     Named with a `!@` suffix.
     """
 
+    __slots__ = ("memo_word",)
+
     def __init__(self, memo_word: ModuleMemoWord):
         super().__init__(f"{memo_word.name}!@")
         self.memo_word = memo_word
@@ -215,10 +297,15 @@ class ExecuteWord(Word):
     Used for prefixed module imports to create words like `prefix.word`.
     """
 
+    __slots__ = ("target_word",)
+
     def __init__(self, name: str, target_word: Word):
         super().__init__(name)
         self.target_word = target_word
 
+    def execute_sync(self, interp: Interpreter) -> bool:
+        return self.target_word.execute_sync(interp)
+
     async def execute(self, interp: Interpreter) -> None:
         await self.target_word.execute(interp)
 
@@ -228,17 +315,41 @@ class ModuleWord(Word):
 
     Used for module words created via decorators or add_module_word().
     Integrates per-word error handler functionality.
+
+    The handler may be any callable; if it returns an awaitable, that is
+    awaited. Handlers generated by the word decorators from plain methods are
+    marked as sync and run through `execute_sync` when there are no error
+    handlers to consult.
     """
 
-    def __init__(self, name: str, handler: WordHandler):
+    __slots__ = ("handler", "is_async")
+
+    def __init__(self, name: str, handler: WordHandler | SyncWordHandler):
         super().__init__(name)
         self.handler = handler
+        self.is_async = not getattr(handler, "_forthic_sync", False)
+
+    def execute_sync(self, interp: Interpreter) -> bool:
+        # Error handlers are async, so defer to execute() when any are registered
+        if self.is_async or self.error_handlers:
+            return False
+        self.handler(interp)
+        return True
+
+    async def _run_handler(self, interp: Interpreter) -> None:
+        result = self.handler(interp)
+        # Covers async def handlers as well as lambdas or objects that return a coroutine
+        if inspect.isawaitable(result):
+            await result
 
     async def execute(self, interp: Interpreter) -> None:
-        from .errors import IntentionalStopError
+        # Fast path: with no error handlers there is nothing to catch
+        if not self.error_handlers:
+            await self._run_handler(interp)
+            return
 
         try:
-            await self.handler(interp)
+            await self._run_handler(interp)
         except IntentionalStopError:
             # Never handle intentional flow control errors
             raise
@@ -263,10 +374,12 @@ class Module:
 
     def __init__(self, name: str, forthic_code: str = ""):
         self.words: list[Word] = []
-        self.exportable: list[str] = []
+        # Most recently added word for each name (kept in sync by add_word)
+        self._words_by_name: dict[str, Word] = {}
+        self.exportable: set[str] = set()
         self.variables: dict[str, Variable] = {}
         self.modules: dict[str, Module] = {}
-        self.module_prefixes: dict[str, set[str]] = {}
+        self.module_prefixes: dict[str, list[str]] = {}
         self.name = name
         self.forthic_code = forthic_code
         self.interp: Interpreter | None = None
@@ -288,6 +401,7 @@ class Module:
         """Create a shallow duplicate of this module."""
         result = Module(self.name)
         result.words = self.words.copy()
+        result._words_by_name = self._words_by_name.copy()
         result.exportable = self.exportable.copy()
         result.variables = {k: v.dup() for k, v in self.variables.items()}
         result.modules = self.modules.copy()
@@ -298,15 +412,15 @@ class Module:
         """Create a copy with module prefixes restored."""
         result = Module(self.name)
         result.words = self.words.copy()
+        result._words_by_name = self._words_by_name.copy()
         result.exportable = self.exportable.copy()
         result.variables = {k: v.dup() for k, v in self.variables.items()}
-        result.modules = self.modules.copy()
-
-        # Restore module_prefixes
-        for module_name, prefixes in self.module_prefixes.items():
-            for prefix in prefixes:
-                result.import_module(prefix, self.modules[module_name], interp)
-
+        # Each imported module is duplicated so the copy doesn't share module state
+        result.modules = {name: module.dup() for name, module in self.modules.items()}
+        # Imported words (and their ExecuteWord wrappers) are already in self.words and
+        # Module.dup shares word objects, so the prefix table can be copied directly
+        # rather than re-importing
+        result.module_prefixes = {k: v.copy() for k, v in self.module_prefixes.items()}
         result.forthic_code = self.forthic_code
         return result
 
@@ -318,9 +432,9 @@ class Module:
     def register_module(self, module_name: str, prefix: str, module: Module) -> None:
         self.modules[module_name] = module
 
-        if module_name not in self.module_prefixes:
-            self.module_prefixes[module_name] = set()
-        self.module_prefixes[module_name].add(prefix)
+        prefixes = self.module_prefixes.setdefault(module_name, [])
+        if prefix not in prefixes:
+            prefixes.append(prefix)
 
     def import_module(self, prefix: str, module: Module, interp: Interpreter) -> None:
         new_module = module.dup()
@@ -340,24 +454,25 @@ class Module:
 
     def add_word(self, word: Word) -> None:
         self.words.append(word)
+        self._words_by_name[word.name] = word
 
     def add_memo_words(self, word: Word) -> ModuleMemoWord:
         """Add a memo word and its ! and !@ variants."""
         memo_word = ModuleMemoWord(word)
-        self.words.append(memo_word)
-        self.words.append(ModuleMemoBangWord(memo_word))
-        self.words.append(ModuleMemoBangAtWord(memo_word))
+        self.add_word(memo_word)
+        self.add_word(ModuleMemoBangWord(memo_word))
+        self.add_word(ModuleMemoBangAtWord(memo_word))
         return memo_word
 
     def add_exportable(self, names: list[str]) -> None:
-        self.exportable.extend(names)
+        self.exportable.update(names)
 
     def add_exportable_word(self, word: Word) -> None:
-        self.words.append(word)
-        self.exportable.append(word.name)
+        self.add_word(word)
+        self.exportable.add(word.name)
 
     def add_module_word(
-        self, word_name: str, word_func: Callable[[Interpreter], Coroutine[Any, Any, None]]
+        self, word_name: str, word_func: WordHandler | SyncWordHandler
     ) -> ModuleWord:
         """Add a word with a handler function."""
         word = ModuleWord(word_name, word_func)
@@ -366,11 +481,8 @@ class Module:
 
     def exportable_words(self) -> list[Word]:
         """Get list of exportable words."""
-        result: list[Word] = []
-        for word in self.words:
-            if word.name in self.exportable:
-                result.append(word)
-        return result
+        exportable = self.exportable
+        return [word for word in self.words if word.name in exportable]
 
     def find_word(self, name: str) -> Word | None:
         """Find a word by name (checks dictionary words and variables)."""
@@ -380,19 +492,17 @@ class Module:
         return result
 
     def find_dictionary_word(self, word_name: str) -> Word | None:
-        """Find a word in the module's dictionary."""
-        # Search from most recent to oldest
-        for word in reversed(self.words):
-            if word.name == word_name:
-                return word
-        return None
+        """Find a word in the module's dictionary (most recently added wins)."""
+        return self._words_by_name.get(word_name)
 
     def find_variable(self, varname: str) -> PushValueWord | None:
         """Find a variable and return it as a PushValueWord."""
         var_result = self.variables.get(varname)
-        if var_result:
-            return PushValueWord(varname, var_result)
-        return None
+        if var_result is None:
+            return None
+        if var_result._push_word is None:
+            var_result._push_word = PushValueWord(varname, var_result)
+        return var_result._push_word
 
     # Variable management
 
@@ -406,50 +516,32 @@ class Module:
 # Stack
 
 
-class Stack:
-    """Wrapper for the interpreter's data stack.
+class Stack(list[Any]):
+    """The interpreter's data stack.
 
-    Provides stack operations with support for PositionedString unwrapping.
+    A list subclass, so pushes, pops, indexing and length are the built-in list
+    operations. Adds helpers for PositionedString unwrapping.
     """
 
-    def __init__(self, items: list[Any] | None = None):
-        self._items: list[Any] = items if items is not None else []
+    __slots__ = ()
+
+    push = list.append
 
     def get_items(self) -> list[Any]:
         """Get stack items with PositionedStrings unwrapped."""
         return [
-            item.string if isinstance(item, PositionedString) else item
-            for item in self._items
+            item.string if type(item) is PositionedString else item
+            for item in self
         ]
 
     def get_raw_items(self) -> list[Any]:
         """Get raw stack items (including PositionedStrings)."""
-        return self._items
+        return self
 
     def set_raw_items(self, items: list[Any]) -> None:
         """Set raw stack items."""
-        self._items = items
-
-    def pop(self) -> Any:
-        """Pop an item from the stack."""
-        return self._items.pop()
-
-    def push(self, item: Any) -> None:
-        """Push an item onto the stack."""
-        self._items.append(item)
-
-    def __len__(self) -> int:
-        """Get stack length."""
-        return len(self._items)
-
-    def __getitem__(self, index: int) -> Any:
-        """Get item at index."""
-        return self._items[index]
-
-    def __setitem__(self, index: int, value: Any) -> None:
-        """Set item at index."""
-        self._items[index] = value
+        self[:] = items
 
     def dup(self) -> Stack:
         """Create a shallow copy of the stack."""
-        return Stack(self._items.copy())
+        return Stack(self)
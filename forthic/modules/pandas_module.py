@@ -10,9 +10,14 @@ Provides comprehensive pandas integration for Forthic including:
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import Any
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
     raise ImportError(
@@ -22,6 +27,426 @@ except ImportError:
 
 from ..decorators import DecoratedModule, ForthicDirectWord, register_module_doc
 from ..decorators import ForthicWord as WordDecorator
+from ..errors import UnknownWordError
+from ..module import PushValueWord
+from ..tokenizer import Tokenizer, TokenType
+from .standard.boolean_module import BooleanModule
+from .standard.core_module import CoreModule
+from .standard.record_module import RecordModule
+
+# Forthic comparison words and their DataFrame.query() operators
+_QUERY_COMPARISONS = {"==": "==", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+_QUERY_LOGIC = {"AND": "&", "OR": "|"}
+
+# The standard-library words a DF.FILTER predicate may use to be translated to a query
+_QUERY_WORDS = {
+    "REC@": RecordModule.REC_at,
+    "DUP": CoreModule.DUP,
+    "SWAP": CoreModule.SWAP,
+    "POP": CoreModule.POP,
+    "==": BooleanModule.equals,
+    "!=": BooleanModule.not_equals,
+    "<": BooleanModule.less_than,
+    "<=": BooleanModule.less_than_or_equal,
+    ">": BooleanModule.greater_than,
+    ">=": BooleanModule.greater_than_or_equal,
+    "AND": BooleanModule.AND,
+    "OR": BooleanModule.OR,
+    "NOT": BooleanModule.NOT,
+}
+
+# GroupBy reductions that accept pandas' engine= argument
+_ENGINE_AGGREGATIONS = frozenset({"sum", "mean", "std", "var", "min", "max"})
+
+# A pattern without these matches exactly like a plain substring
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+async def _apply_to_whole_series(
+    interp: Any, series: pd.Series, forthic: str, string_location: Any, word_name: str
+) -> pd.Series:
+    """Run Forthic once against a whole Series instead of once per value.
+
+    Snippets like '2 *' or '10 + 2 /' work unchanged on a Series via pandas'
+    vectorized operators. The snippet must leave a Series aligned with the
+    input (or an ndarray of the same length); anything else raises.
+    """
+    interp.stack_push(series)
+    await interp.run(forthic, string_location)
+    result = interp.stack_pop()
+    if isinstance(result, pd.Series) and result.index.equals(series.index):
+        return result.rename(series.name)
+    if isinstance(result, np.ndarray) and result.shape == (len(series),):
+        return pd.Series(result, index=series.index, name=series.name)
+    raise ValueError(
+        f"{word_name} code must return a Series or array of {len(series)} values "
+        f"when vectorized, got {type(result).__name__}"
+    )
+
+
+def _is_literal_pattern(pattern: Any) -> bool:
+    """Return True if a regex pattern string contains no regex metacharacters."""
+    return isinstance(pattern, str) and _REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+def _str_method(series: pd.Series, name: str) -> pd.Series:
+    """Apply a no-argument str method (e.g. 'upper') to every value in a Series.
+
+    Arrow-backed string Series go through pandas' .str accessor, which runs
+    pyarrow.compute kernels over the string buffer. An object Series holding
+    only str values skips the accessor's missing-value masking and result
+    inference and calls the method through a numpy ufunc loop instead.
+    """
+    if series.dtype == object and pd.api.types.infer_dtype(series, skipna=False) == "string":
+        values = np.frompyfunc(getattr(str, name), 1, 1)(series.to_numpy())
+        return pd.Series(values, index=series.index, name=series.name)
+    return getattr(series.str, name)()
+
+
+def _is_none_or_empty(obj: Any) -> bool:
+    """Return True for None or a DataFrame/Series with no rows (or no columns).
+
+    Same result as `obj is None or obj.empty`; DataFrame.empty loops over both
+    axes through a generator, which is several times slower than reading shape.
+    """
+    return obj is None or 0 in obj.shape
+
+
+def _row_records(df: pd.DataFrame) -> Iterator[dict]:
+    """Yield each row of df as a {column: value} dict.
+
+    Builds records from per-column value lists rather than iterrows(), which
+    creates (and dtype-coerces) a Series for every row.
+    """
+    columns = df.columns.tolist()
+    column_values = [df.iloc[:, j].tolist() for j in range(len(columns))]
+    for values in zip(*column_values, strict=True):
+        yield dict(zip(columns, values, strict=True))
+
+
+def _resolves_to_standard_word(interp: Any, name: str) -> bool:
+    """Return True if name runs the standard-library word the query translation models."""
+    try:
+        word = interp.find_word(name)
+    except UnknownWordError:
+        return False
+    return getattr(getattr(word, "handler", None), "__func__", None) is _QUERY_WORDS[name]
+
+
+def _query_column_kind(column: pd.Series) -> str | None:
+    """Return "number" or "string" for columns query() compares like Python does, else None."""
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return "number"
+    # REC@ pushes nothing for None, which query() cannot reproduce
+    if pd.api.types.infer_dtype(column, skipna=False) == "string":
+        return "string"
+    return None
+
+
+def _forthic_predicate_to_query(interp: Any, forthic: str, df: pd.DataFrame) -> str | None:
+    """Translate a simple DF.FILTER predicate into a DataFrame.query() expression.
+
+    Recognizes column comparisons such as '"age" REC@ 30 >' or
+    'DUP "age" REC@ 30 > SWAP "city" REC@ "NYC" == AND', built from REC@,
+    comparisons, AND, OR, NOT, DUP, SWAP and POP. The row record is modeled as
+    the initial stack item. Returns None for anything else so the caller can
+    fall back to running the predicate per row.
+
+    Words are only translated when they resolve to the standard-library words,
+    so redefinitions keep their meaning. Only numeric columns (compared with
+    numbers) and string columns (compared with string constants) are
+    translated; datetime, categorical and other object columns compare
+    differently in query() than per row.
+    """
+    # Entries are ("record", None), ("const", value), ("field", column) or ("bool", expression)
+    stack: list[tuple[str, Any]] = [("record", None)]
+    field_kinds: dict[str, str] = {}
+
+    def operand(entry: tuple[str, Any]) -> str:
+        kind, value = entry
+        return f"`{value}`" if kind == "field" else repr(value)
+
+    def value_kind(entry: tuple[str, Any]) -> str | None:
+        kind, value = entry
+        if kind == "field":
+            return field_kinds[value]
+        if kind == "const":
+            return "string" if isinstance(value, str) else "number"
+        return None
+
+    tokenizer = Tokenizer(forthic)
+    while True:
+        token = tokenizer.next_token()
+        if token.type == TokenType.EOS:
+            break
+        if token.type == TokenType.COMMENT:
+            continue
+        if token.type == TokenType.STRING:
+            stack.append(("const", token.string))
+            continue
+        if token.type != TokenType.WORD:
+            return None
+
+        name = token.string
+        if name in _QUERY_WORDS and not _resolves_to_standard_word(interp, name):
+            return None
+        if name == "REC@":
+            if len(stack) < 2 or stack[-1][0] != "const" or stack[-2][0] != "record":
+                return None
+            field = stack.pop()[1]
+            if not isinstance(field, str) or "`" in field or field not in df.columns:
+                return None
+            column_kind = _query_column_kind(df[field])
+            if column_kind is None:
+                return None
+            field_kinds[field] = column_kind
+            stack[-1] = ("field", field)
+        elif name == "DUP":
+            if not stack:
+                return None
+            stack.append(stack[-1])
+        elif name == "SWAP":
+            if len(stack) < 2:
+                return None
+            stack[-1], stack[-2] = stack[-2], stack[-1]
+        elif name == "POP":
+            if not stack:
+                return None
+            stack.pop()
+        elif name in _QUERY_COMPARISONS:
+            if len(stack) < 2:
+                return None
+            b, a = stack.pop(), stack.pop()
+            if a[0] not in ("field", "const") or b[0] not in ("field", "const"):
+                return None
+            if "field" not in (a[0], b[0]) or value_kind(a) != value_kind(b):
+                return None
+            # Strings are only compared with string constants
+            if value_kind(a) == "string" and a[0] == b[0]:
+                return None
+            stack.append(("bool", f"({operand(a)} {_QUERY_COMPARISONS[name]} {operand(b)})"))
+        elif name in _QUERY_LOGIC:
+            if len(stack) < 2 or stack[-1][0] != "bool" or stack[-2][0] != "bool":
+                return None
+            b, a = stack.pop(), stack.pop()
+            stack.append(("bool", f"({a[1]} {_QUERY_LOGIC[name]} {b[1]})"))
+        elif name == "NOT":
+            if not stack or stack[-1][0] != "bool":
+                return None
+            stack.append(("bool", f"(~{stack.pop()[1]})"))
+        else:
+            try:
+                word = interp.find_word(name)
+            except UnknownWordError:
+                return None
+            value = word.value if isinstance(word, PushValueWord) else None
+            if type(value) not in (int, float):
+                return None
+            stack.append(("const", value))
+
+    if len(stack) != 1 or stack[0][0] != "bool":
+        return None
+    return stack[0][1]
+
+
+def _labels_for_index(index: pd.Index, labels: list) -> Any:
+    """Return labels in a form index.isin can match without dtype coercion.
+
+    isin no longer matches castable values (e.g. date strings against a
+    DatetimeIndex), so labels are cast to the index dtype. Casting can also
+    change labels (1.5 -> 1, True -> 1); when it does, the labels present in
+    the index are picked out by label lookup instead.
+    """
+    if index.dtype.kind != "b" and any(isinstance(label, (bool, np.bool_)) for label in labels):
+        return [label for label in labels if label in index]
+    original = pd.Index(labels)
+    try:
+        cast = original.astype(index.dtype, copy=False)
+        if bool((cast == original).all()):
+            return cast
+    except (TypeError, ValueError):
+        pass
+    return [label for label in labels if label in index]
+
+
+def _auto_categorical(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Return df with low-cardinality string key columns converted to categoricals.
+
+    Grouping on categorical codes avoids hashing every string again. A key is
+    converted when fewer than half of its values are distinct; the caller's
+    frame is left untouched (only a shallow copy is modified).
+    """
+    if not df.columns.is_unique:
+        return df
+
+    result = df
+    for key in keys:
+        if not isinstance(key, str) or key not in df.columns:
+            continue
+        column = df[key]
+        if column.dtype != object or pd.api.types.infer_dtype(column) != "string":
+            continue
+        categorical = column.astype("category")
+        if len(categorical.cat.categories) >= len(column) * 0.5:
+            continue
+        if result is df:
+            result = df.copy(deep=False)
+        result[key] = categorical
+    return result
+
+
+def _records_to_frame(records: Any) -> pd.DataFrame:
+    """Build a DataFrame from records, skipping key unioning when all share one schema.
+
+    pd.DataFrame(list_of_dicts) unions every record's keys and looks up each
+    key per record. When every record is a dict with the same keys, pulling
+    the values out as tuples with one itemgetter is cheaper and goes through
+    the same per-column dtype inference.
+    """
+    first = records[0] if type(records) is list else None
+    if type(first) is not dict or len(first) < 2:
+        return pd.DataFrame(records)
+    if set(map(type, records)) != {dict} or set(map(len, records)) != {len(first)}:
+        return pd.DataFrame(records)
+
+    columns = list(first)
+    try:
+        rows = list(map(itemgetter(*columns), records))
+    except KeyError:
+        # Same number of keys but different names
+        return pd.DataFrame(records)
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert object columns holding only strings (and missing values) to string[pyarrow]."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "The .strings 'arrow' option requires pyarrow to be installed. "
+            "Install with: pip install pyarrow"
+        ) from None
+
+    string_columns = {
+        column: "string[pyarrow]"
+        for column in df.select_dtypes(include="object").columns
+        if pd.api.types.infer_dtype(df[column], skipna=True) == "string"
+    }
+    if not string_columns:
+        return df
+    return df.astype(string_columns)
+
+
+def _read_csv_arrow(filepath: str, options: dict[str, Any]) -> pd.DataFrame:
+    """Read a CSV with pyarrow's multithreaded reader, converting to pandas without a copy.
+
+    Only sep and dtype map onto pyarrow's reader options; anything else goes
+    through pd.read_csv(engine="pyarrow"), which uses the same parser.
+    """
+    try:
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        raise ImportError(
+            "The .engine 'pyarrow' option requires pyarrow to be installed. "
+            "Install with: pip install pyarrow"
+        ) from None
+
+    if not set(options) <= {"sep", "dtype"}:
+        return pd.read_csv(filepath, engine="pyarrow", **options)
+
+    table = pa_csv.read_csv(
+        filepath,
+        parse_options=pa_csv.ParseOptions(delimiter=options.get("sep", ",")),
+        convert_options=pa_csv.ConvertOptions(column_types=options.get("dtype")),
+    )
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _read_csv_chunked(filepath: str, options: dict[str, Any]) -> pd.DataFrame:
+    """Read a CSV chunksize rows at a time and stitch the chunks into one DataFrame.
+
+    Peak parser memory is bounded by the chunk size rather than the file, which
+    pairs well with usecols/dtype to keep the final frame small.
+    """
+    with pd.read_csv(filepath, **options) as reader:
+        return pd.concat(reader, ignore_index=True)
+
+
+def _agg_with_engine(obj: Any, agg_spec: Any, engine: str, engine_kwargs: Any) -> Any:
+    """Run a grouped reduction through pandas' engine= argument (e.g. numba JIT kernels)."""
+    engine_kwargs = _check_engine(obj, agg_spec, engine, engine_kwargs)
+    return getattr(obj, agg_spec)(engine=engine, engine_kwargs=engine_kwargs)
+
+
+def _check_engine(obj: Any, func_name: Any, engine: str, engine_kwargs: Any) -> Any:
+    """Validate an .engine option for a grouped reduction and return its engine_kwargs."""
+    if not isinstance(obj, pd.core.groupby.GroupBy) or func_name not in _ENGINE_AGGREGATIONS:
+        raise ValueError(
+            "The .engine option requires a grouped DataFrame and one of: "
+            + ", ".join(sorted(_ENGINE_AGGREGATIONS))
+        )
+
+    if engine == "numba":
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The .engine 'numba' option requires numba to be installed. "
+                "Install with: pip install numba"
+            ) from None
+        if engine_kwargs is None:
+            engine_kwargs = {"nopython": True, "nogil": True, "parallel": True}
+
+    return engine_kwargs
+
+
+def _gram_matrix(df: pd.DataFrame, dtype: Any, normalize: bool) -> pd.DataFrame | None:
+    """Covariance (or Pearson correlation if normalize) via one BLAS matrix product.
+
+    pandas computes these pairwise in float64 so it can skip missing values per
+    pair. With no missing values, centering the data and computing X.T @ X in
+    the requested dtype gives the same matrix. Returns None when that doesn't
+    apply (non-float dtype, non-numeric columns, missing values, fewer than two
+    rows) so the caller can fall back to pandas.
+    """
+    numeric = df.select_dtypes(include=["number", "bool"])
+    if numeric.shape[1] != df.shape[1] or len(numeric) < 2:
+        return None
+
+    try:
+        # Centering and scaling happen in place, which needs a float dtype
+        if np.dtype(dtype).kind != "f":
+            return None
+        values = numeric.to_numpy(dtype=dtype)
+    except (TypeError, ValueError):
+        return None
+    if np.isnan(values).any():
+        return None
+
+    values -= values.mean(axis=0)
+    matrix = (values.T @ values) / (len(values) - 1)
+
+    if normalize:
+        std = np.sqrt(np.diag(matrix))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix /= np.outer(std, std)
+        np.clip(matrix, -1, 1, out=matrix)
+        # Exact ones on the diagonal, NaN for constant columns (as pandas does)
+        np.fill_diagonal(matrix, np.where(std > 0, 1, np.nan))
+
+    return pd.DataFrame(matrix, index=numeric.columns, columns=numeric.columns)
+
+
+def _append_records(df: pd.DataFrame, records: list[dict]) -> pd.DataFrame:
+    """Concatenate records onto df with a fresh RangeIndex, in a single copy."""
+    new_rows = pd.DataFrame(records)
+    if df.shape == (0, 0):
+        # Nothing to keep from an empty frame; skip concat's copy and dtype checks
+        return new_rows
+    # Use pd.concat for modern pandas (append is deprecated)
+    return pd.concat([df, new_rows], ignore_index=True)
 
 
 class PandasModule(DecoratedModule):
@@ -63,17 +488,44 @@ DF>
     # Conversion Operations
     # ==================
 
-    @WordDecorator("( records:list -- df:DataFrame )", "Convert list of records to DataFrame", ">DF")
-    async def to_DF(self, records: list) -> pd.DataFrame:
-        """Convert list of records (dicts) to DataFrame."""
+    @WordDecorator(
+        "( records:list [options:WordOptions] -- df:DataFrame )",
+        "Convert list of records to DataFrame",
+        ">DF",
+    )
+    def to_DF(self, records: list, options: dict[str, Any]) -> pd.DataFrame:
+        """Convert list of records (dicts) to DataFrame.
+
+        Options:
+            columns: list - Columns to build, in order (other keys are ignored,
+                missing ones become NA)
+            dtypes: dict - {column: dtype} applied after construction
+            strings: 'arrow' stores string columns as string[pyarrow] (requires pyarrow)
+        """
+        columns = options.get("columns")
+        dtypes = options.get("dtypes")
+
         if records is None or len(records) == 0:
-            return pd.DataFrame()
-        return pd.DataFrame(records)
+            # Without records, the dtypes keys are the only column names there are
+            if columns is None and dtypes:
+                columns = list(dtypes)
+            df = pd.DataFrame(columns=columns)
+        elif columns is not None:
+            # Known columns: no key union or column reordering needed
+            df = pd.DataFrame.from_records(records, columns=columns)
+        else:
+            df = _records_to_frame(records)
+
+        if dtypes:
+            df = df.astype(dtypes)
+        if options.get("strings") == "arrow":
+            df = _to_arrow_strings(df)
+        return df
 
     @WordDecorator("( df:DataFrame -- records:list )", "Convert DataFrame to list of records", "DF>")
-    async def DF_to(self, df: pd.DataFrame) -> list:
+    def DF_to(self, df: pd.DataFrame) -> list:
         """Convert DataFrame to list of records."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return []
         return df.to_dict("records")
 
@@ -82,7 +534,7 @@ DF>
         "Convert list to Series with optional index and name",
         ">SERIES",
     )
-    async def to_SERIES(self, values: list, options: dict[str, Any]) -> pd.Series:
+    def to_SERIES(self, values: list, options: dict[str, Any]) -> pd.Series:
         """Convert list to Series with optional index and name.
 
         Options:
@@ -97,10 +549,24 @@ DF>
 
         return pd.Series(values, index=index, name=name)
 
-    @WordDecorator("( series:Series -- values:list )", "Convert Series to list of values", "SERIES>")
-    async def SERIES_to(self, series: pd.Series) -> list:
-        """Convert Series to list of values."""
-        if series is None or series.empty:
+    @WordDecorator(
+        "( series:Series [options:WordOptions] -- values:any )",
+        "Convert Series to list of values",
+        "SERIES>",
+    )
+    def SERIES_to(self, series: pd.Series, options: dict[str, Any]) -> Any:
+        """Convert Series to list of values.
+
+        Options:
+            as: 'numpy' returns the underlying ndarray (no copy where possible)
+                instead of boxing every value into a Python list
+        """
+        if options.get("as") == "numpy":
+            if series is None:
+                return np.array([])
+            return series.to_numpy(copy=False)
+
+        if _is_none_or_empty(series):
             return []
         return series.tolist()
 
@@ -113,7 +579,7 @@ DF>
         "Print DataFrame info to stdout, return df for chaining",
         "DF.INFO",
     )
-    async def DF_INFO(self, df: pd.DataFrame) -> pd.DataFrame:
+    def DF_INFO(self, df: pd.DataFrame) -> pd.DataFrame:
         """Print DataFrame info and return df for chaining."""
         if df is None:
             print("None")
@@ -127,57 +593,61 @@ DF>
         "Get first n rows (default 5)",
         "DF.HEAD",
     )
-    async def DF_HEAD(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_HEAD(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Get first n rows (default 5)."""
         if df is None:
             return pd.DataFrame()
 
+        # Same rows as df.head(n); under copy-on-write head() copies them, iloc doesn't
         n = options.get("n", 5)
-        return df.head(n)
+        return df.iloc[:n]
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- df:DataFrame )",
         "Get last n rows (default 5)",
         "DF.TAIL",
     )
-    async def DF_TAIL(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_TAIL(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Get last n rows (default 5)."""
         if df is None:
             return pd.DataFrame()
 
+        # Same rows as df.tail(n), as an iloc slice (see DF.HEAD)
         n = options.get("n", 5)
-        return df.tail(n)
+        if n == 0:
+            return df.iloc[0:0]
+        return df.iloc[-n:]
 
     @WordDecorator("( df:DataFrame -- shape:list )", "Get DataFrame shape as [rows, cols]", "DF.SHAPE")
-    async def DF_SHAPE(self, df: pd.DataFrame) -> list:
+    def DF_SHAPE(self, df: pd.DataFrame) -> list:
         """Get DataFrame shape as [rows, cols]."""
         if df is None:
             return [0, 0]
         return list(df.shape)
 
     @WordDecorator("( df:DataFrame -- columns:list )", "Get list of column names", "DF.COLUMNS")
-    async def DF_COLUMNS(self, df: pd.DataFrame) -> list:
+    def DF_COLUMNS(self, df: pd.DataFrame) -> list:
         """Get list of column names."""
         if df is None:
             return []
         return df.columns.tolist()
 
     @WordDecorator("( df:DataFrame -- dtypes:dict )", "Get column data types as dict {col: dtype}", "DF.DTYPES")
-    async def DF_DTYPES(self, df: pd.DataFrame) -> dict:
+    def DF_DTYPES(self, df: pd.DataFrame) -> dict:
         """Get column data types as dict."""
         if df is None:
             return {}
         return df.dtypes.astype(str).to_dict()
 
     @WordDecorator("( df:DataFrame -- stats:DataFrame )", "Get summary statistics", "DF.DESCRIBE")
-    async def DF_DESCRIBE(self, df: pd.DataFrame) -> pd.DataFrame:
+    def DF_DESCRIBE(self, df: pd.DataFrame) -> pd.DataFrame:
         """Get summary statistics."""
         if df is None:
             return pd.DataFrame()
         return df.describe()
 
     @WordDecorator("( df:DataFrame -- counts:dict )", "Count unique values per column", "DF.NUNIQUE")
-    async def DF_NUNIQUE(self, df: pd.DataFrame) -> dict:
+    def DF_NUNIQUE(self, df: pd.DataFrame) -> dict:
         """Count unique values per column."""
         if df is None:
             return {}
@@ -188,22 +658,24 @@ DF>
     # ==================
 
     @WordDecorator("( df:DataFrame column:str -- series:Series )", "Get column by name", "DF@")
-    async def DF_at(self, df: pd.DataFrame, column: str) -> pd.Series:
+    def DF_at(self, df: pd.DataFrame, column: str) -> pd.Series:
         """Get single column as Series."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series()
         if column not in df.columns:
             raise KeyError(f"Column '{column}' not found in DataFrame")
         return df[column]
 
     @WordDecorator("( df:DataFrame columns:list -- df:DataFrame )", "Get multiple columns as DataFrame", "DF@@")
-    async def DF_at_at(self, df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    def DF_at_at(self, df: pd.DataFrame, columns: list) -> pd.DataFrame:
         """Get multiple columns as DataFrame."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
         if not columns:
             return pd.DataFrame()
-        missing = [col for col in columns if col not in df.columns]
+        # One set build beats a pandas Index lookup per requested column
+        col_set = set(df.columns)
+        missing = [col for col in columns if col not in col_set]
         if missing:
             raise KeyError(f"Columns not found in DataFrame: {missing}")
         return df[columns]
@@ -213,56 +685,74 @@ DF>
         "Set or add column to DataFrame",
         "<DF!",
     )
-    async def l_DF_bang(self, df: pd.DataFrame, series: pd.Series, column: str) -> pd.DataFrame:
+    def l_DF_bang(self, df: pd.DataFrame, series: pd.Series, column: str) -> pd.DataFrame:
         """Set or add column to DataFrame (returns new DataFrame)."""
         if df is None:
             df = pd.DataFrame()
 
+        # assign() deep-copies every column; a shallow copy only adds the new one
+        result = df.copy(deep=False)
+
         # Handle both Series and list/array-like inputs
         if isinstance(series, pd.Series):
-            return df.assign(**{column: series})
+            result[column] = series
         else:
-            return df.assign(**{column: pd.Series(series)})
+            result[column] = pd.Series(series)
+        return result
 
     @WordDecorator("( df:DataFrame columns:list -- df:DataFrame )", "Drop columns from DataFrame", "DF.DROP-COLS")
-    async def DF_DROP_COLS(self, df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    def DF_DROP_COLS(self, df: pd.DataFrame, columns: list) -> pd.DataFrame:
         """Drop columns from DataFrame."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
         if not columns:
             return df
         # Only drop columns that exist
-        to_drop = [col for col in columns if col in df.columns]
-        if not to_drop:
+        drop_mask = df.columns.isin(columns)
+        if not drop_mask.any():
             return df
-        return df.drop(columns=to_drop)
+        return df.iloc[:, ~drop_mask]
 
     @WordDecorator(
         "( df:DataFrame mapping:dict -- df:DataFrame )",
         "Rename columns using dict mapping",
         "DF.RENAME-COLS",
     )
-    async def DF_RENAME_COLS(self, df: pd.DataFrame, mapping: dict) -> pd.DataFrame:
+    def DF_RENAME_COLS(self, df: pd.DataFrame, mapping: dict) -> pd.DataFrame:
         """Rename columns using dict mapping {old_name: new_name}."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
         if not mapping:
             return df
-        return df.rename(columns=mapping)
+        if isinstance(df.columns, pd.MultiIndex):
+            return df.rename(columns=mapping)
+
+        columns = df.columns
+        if not any(column in mapping for column in columns):
+            return df
+
+        # rename() deep-copies the data; only the column labels change here
+        result = df.copy(deep=False)
+        result.columns = pd.Index(
+            [mapping.get(column, column) for column in columns],
+            name=columns.name,
+            tupleize_cols=False,
+        )
+        return result
 
     @WordDecorator(
         "( df:DataFrame dtypes:any -- df:DataFrame )",
         "Select columns by data type(s)",
         "DF.SELECT-DTYPES",
     )
-    async def DF_SELECT_DTYPES(self, df: pd.DataFrame, dtypes: Any) -> pd.DataFrame:
+    def DF_SELECT_DTYPES(self, df: pd.DataFrame, dtypes: Any) -> pd.DataFrame:
         """Select columns by data type(s).
 
         Args:
             dtypes: Single dtype string or list of dtype strings
                     (e.g., 'number', 'object', ['int64', 'float64'])
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         # Handle both single dtype and list of dtypes
@@ -271,18 +761,34 @@ DF>
 
         return df.select_dtypes(include=dtypes)
 
-    @ForthicDirectWord("( df:DataFrame column:str forthic:str -- series:Series )", "Apply Forthic to column", "DF.APPLY-COL")
+    @ForthicDirectWord(
+        "( df:DataFrame column:str forthic:str [options:WordOptions] -- series:Series )",
+        "Apply Forthic to column",
+        "DF.APPLY-COL",
+    )
     async def DF_APPLY_COL(self, interp) -> None:
         """Apply Forthic code to each value in a column.
 
         The Forthic code receives each column value on the stack and should
         leave a transformed value on the stack.
+
+        Options:
+            vectorized: Run the code once on the whole column as a Series; it
+                should leave a Series of the same length (default: False)
         """
+        options = {}
+        if len(interp.get_stack()) > 0:
+            top = interp.stack_peek()
+            from ..word_options import WordOptions
+            if isinstance(top, WordOptions):
+                opts = interp.stack_pop()
+                options = opts.to_dict()
+
         forthic = interp.stack_pop()
         column = interp.stack_pop()
         df = interp.stack_pop()
 
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             interp.stack_push(pd.Series())
             return
 
@@ -290,52 +796,107 @@ DF>
             raise KeyError(f"Column '{column}' not found in DataFrame")
 
         string_location = interp.get_string_location()
-        result = []
 
-        for value in df[column]:
+        if options.get("vectorized", False):
+            series = await _apply_to_whole_series(
+                interp, df[column], forthic, string_location, "DF.APPLY-COL"
+            )
+            interp.stack_push(series)
+            return
+
+        result = np.empty(len(df), dtype=object)
+        for i, value in enumerate(df[column]):
             interp.stack_push(value)
             await interp.run(forthic, string_location)
-            result.append(interp.stack_pop())
+            result[i] = interp.stack_pop()
+
+        # Same dtype inference pd.Series(list) would do, without the list
+        interp.stack_push(pd.Series(result, index=df.index, name=column).infer_objects())
+
+    @ForthicDirectWord(
+        "( df:DataFrame column:str batch_size:int forthic:str -- series:Series )",
+        "Apply Forthic to column in blocks of values",
+        "DF.APPLY-COL-BATCH",
+    )
+    async def DF_APPLY_COL_BATCH(self, interp) -> None:
+        """Apply Forthic code to a column one block of values at a time.
+
+        The Forthic code receives an ndarray of up to batch_size values and
+        should leave an array (or list/Series) of the same length, so the code
+        runs len(column) / batch_size times instead of once per value.
+        """
+        forthic = interp.stack_pop()
+        batch_size = interp.stack_pop()
+        column = interp.stack_pop()
+        df = interp.stack_pop()
+
+        if _is_none_or_empty(df):
+            interp.stack_push(pd.Series())
+            return
+
+        if column not in df.columns:
+            raise KeyError(f"Column '{column}' not found in DataFrame")
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"Batch size must be a positive integer, got {batch_size!r}")
+
+        string_location = interp.get_string_location()
+        values = df[column].to_numpy()
+
+        blocks = []
+        for start in range(0, len(values), batch_size):
+            block = values[start : start + batch_size]
+            interp.stack_push(block)
+            await interp.run(forthic, string_location)
+            result = np.asarray(interp.stack_pop())
+            if result.shape != block.shape:
+                raise ValueError(
+                    f"DF.APPLY-COL-BATCH code must return {len(block)} values for each "
+                    f"block, got shape {result.shape}"
+                )
+            blocks.append(result)
 
-        interp.stack_push(pd.Series(result, index=df.index, name=column))
+        interp.stack_push(pd.Series(np.concatenate(blocks), index=df.index, name=column))
 
     @WordDecorator(
         "( df:DataFrame column:str dtype:str -- df:DataFrame )",
         "Convert column to specified dtype",
         "DF.ASTYPE",
     )
-    async def DF_ASTYPE(self, df: pd.DataFrame, column: str, dtype: str) -> pd.DataFrame:
+    def DF_ASTYPE(self, df: pd.DataFrame, column: str, dtype: str) -> pd.DataFrame:
         """Convert column to specified dtype.
 
         Args:
             column: Column name to convert
             dtype: Target dtype (e.g., 'int', 'float', 'str', 'bool')
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         if column not in df.columns:
             raise KeyError(f"Column '{column}' not found in DataFrame")
 
-        return df.assign(**{column: df[column].astype(dtype)})
+        result = df.copy(deep=False)
+        result[column] = df[column].astype(dtype)
+        return result
 
     # ==================
     # Row Operations
     # ==================
 
     @WordDecorator("( df:DataFrame index:int -- record:dict )", "Get row by position as record", "DF.ILOC")
-    async def DF_ILOC(self, df: pd.DataFrame, index: int) -> dict:
+    def DF_ILOC(self, df: pd.DataFrame, index: int) -> dict:
         """Get row by position (integer index) as record."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return {}
         if index < 0 or index >= len(df):
             raise IndexError(f"Row index {index} out of range for DataFrame with {len(df)} rows")
         return df.iloc[index].to_dict()
 
     @WordDecorator("( df:DataFrame label:any -- record:dict )", "Get row by label as record", "DF.LOC")
-    async def DF_LOC(self, df: pd.DataFrame, label: Any) -> dict:
+    def DF_LOC(self, df: pd.DataFrame, label: Any) -> dict:
         """Get row by label (index value) as record."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return {}
         if label not in df.index:
             raise KeyError(f"Label '{label}' not found in DataFrame index")
@@ -351,37 +912,48 @@ DF>
         forthic = interp.stack_pop()
         df = interp.stack_pop()
 
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             interp.stack_push(pd.DataFrame())
             return
 
+        # Fast path: hand simple column comparisons to pandas in one pass
+        if df.columns.is_unique:
+            expr = _forthic_predicate_to_query(interp, forthic, df)
+            if expr is not None:
+                try:
+                    interp.stack_push(df.query(expr))
+                    return
+                except (TypeError, ValueError):
+                    # The query engine couldn't evaluate the operands; run per row instead
+                    pass
+
         string_location = interp.get_string_location()
-        mask = []
+        mask = np.empty(len(df), dtype=bool)
 
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
-            interp.stack_push(row_dict)
+        for i, record in enumerate(_row_records(df)):
+            interp.stack_push(record)
             await interp.run(forthic, string_location)
-            mask.append(bool(interp.stack_pop()))
+            mask[i] = bool(interp.stack_pop())
 
-        result = df[mask]
+        result = df.iloc[mask]
         interp.stack_push(result)
 
     @WordDecorator("( df:DataFrame indices:list -- df:DataFrame )", "Drop rows by index", "DF.DROP-ROWS")
-    async def DF_DROP_ROWS(self, df: pd.DataFrame, indices: list) -> pd.DataFrame:
+    def DF_DROP_ROWS(self, df: pd.DataFrame, indices: list) -> pd.DataFrame:
         """Drop rows by index labels."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
         if not indices:
             return df
-        # Only drop indices that exist
-        to_drop = [idx for idx in indices if idx in df.index]
-        if not to_drop:
+        labels = indices if df.index.dtype == object else _labels_for_index(df.index, indices)
+        # One vectorized membership pass; labels that don't exist are ignored
+        drop_mask = df.index.isin(labels)
+        if not drop_mask.any():
             return df
-        return df.drop(index=to_drop)
+        return df.iloc[~drop_mask]
 
     @WordDecorator("( df:DataFrame row:dict -- df:DataFrame )", "Append single row to DataFrame", "DF.APPEND-ROW")
-    async def DF_APPEND_ROW(self, df: pd.DataFrame, row: dict) -> pd.DataFrame:
+    def DF_APPEND_ROW(self, df: pd.DataFrame, row: dict) -> pd.DataFrame:
         """Append a single row (record) to DataFrame."""
         if df is None:
             df = pd.DataFrame()
@@ -389,16 +961,34 @@ DF>
         if not row:
             return df
 
-        # Use pd.concat for modern pandas (append is deprecated)
-        new_row_df = pd.DataFrame([row])
-        return pd.concat([df, new_row_df], ignore_index=True)
+        return _append_records(df, [row])
+
+    @WordDecorator(
+        "( df:DataFrame rows:list -- df:DataFrame )",
+        "Append list of rows to DataFrame in one step",
+        "DF.EXTEND-ROWS",
+    )
+    def DF_EXTEND_ROWS(self, df: pd.DataFrame, rows: list) -> pd.DataFrame:
+        """Append several rows (records) to DataFrame.
+
+        Equivalent to repeated DF.APPEND-ROW, but the existing rows are copied
+        once rather than once per appended row.
+        """
+        if df is None:
+            df = pd.DataFrame()
+
+        rows = [row for row in rows or [] if row]
+        if not rows:
+            return df
+
+        return _append_records(df, rows)
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- df:DataFrame )",
         "Random sample of rows with optional parameters",
         "DF.SAMPLE",
     )
-    async def DF_SAMPLE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_SAMPLE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Random sample of rows.
 
         Options:
@@ -406,7 +996,7 @@ DF>
             frac: Fraction of rows to sample (alternative to n)
             random_state: Seed for reproducibility
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         n = options.get("n")
@@ -424,9 +1014,9 @@ DF>
         "Get top N rows by column values",
         "DF.NLARGEST",
     )
-    async def DF_NLARGEST(self, df: pd.DataFrame, column: str, n: int) -> pd.DataFrame:
+    def DF_NLARGEST(self, df: pd.DataFrame, column: str, n: int) -> pd.DataFrame:
         """Get top N rows by column values."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
         if column not in df.columns:
             raise KeyError(f"Column '{column}' not found in DataFrame")
@@ -437,38 +1027,56 @@ DF>
     # ==================
 
     @WordDecorator(
-        "( df:DataFrame columns:any -- grouped:DataFrameGroupBy )",
+        "( df:DataFrame columns:any [options:WordOptions] -- grouped:DataFrameGroupBy )",
         "Group DataFrame by column(s)",
         "DF.GROUP-BY",
     )
-    async def DF_GROUP_BY(self, df: pd.DataFrame, columns: Any) -> Any:
+    def DF_GROUP_BY(self, df: pd.DataFrame, columns: Any, options: dict[str, Any]) -> Any:
         """Group DataFrame by column(s).
 
         Args:
             columns: Single column name or list of column names
+
+        Options:
+            categorical: Group low-cardinality string keys as categoricals (default: False).
+                The result is then indexed by a CategoricalIndex.
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return df.groupby([])
 
+        if not options.get("categorical", False):
+            return df.groupby(columns)
+
         # Handle both single column and list of columns
-        return df.groupby(columns)
+        keys = columns if isinstance(columns, list) else [columns]
+        return _auto_categorical(df, keys).groupby(columns, observed=True)
 
     @WordDecorator(
-        "( df_or_grouped:any agg_spec:any -- df:DataFrame )",
+        "( df_or_grouped:any agg_spec:any [options:WordOptions] -- df:DataFrame )",
         "Aggregate using function name or dict",
         "DF.AGG",
     )
-    async def DF_AGG(self, obj: Any, agg_spec: Any) -> pd.DataFrame:
+    def DF_AGG(self, obj: Any, agg_spec: Any, options: dict[str, Any]) -> pd.DataFrame:
         """Aggregate using function or dict of {column: function}.
 
         Args:
             obj: DataFrame or GroupBy object
             agg_spec: Function name string (e.g., 'sum', 'mean') or dict
+
+        Options:
+            engine: 'numba' (requires numba) or 'cython' for grouped sum, mean,
+                std, var, min and max
+            engine_kwargs: dict passed to the engine (numba default:
+                nopython, nogil and parallel all true)
         """
         if obj is None:
             return pd.DataFrame()
 
-        result = obj.agg(agg_spec)
+        engine = options.get("engine")
+        if engine is None:
+            result = obj.agg(agg_spec)
+        else:
+            result = _agg_with_engine(obj, agg_spec, engine, options.get("engine_kwargs"))
 
         # If result is a Series, convert to DataFrame for consistency
         if isinstance(result, pd.Series):
@@ -481,64 +1089,70 @@ DF>
         "Sum values with optional axis",
         "DF.SUM",
     )
-    async def DF_SUM(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
+    def DF_SUM(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
         """Sum values.
 
         Options:
             axis: 0 for columns (default), 1 for rows
+            numeric_only: Only include numeric and bool columns (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series()
 
         axis = options.get("axis", 0)
-        return df.sum(axis=axis)
+        numeric_only = options.get("numeric_only", False)
+        return df.sum(axis=axis, numeric_only=numeric_only)
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- result:any )",
         "Mean values with optional axis",
         "DF.MEAN",
     )
-    async def DF_MEAN(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
+    def DF_MEAN(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
         """Mean values.
 
         Options:
             axis: 0 for columns (default), 1 for rows
+            numeric_only: Only include numeric and bool columns (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series()
 
         axis = options.get("axis", 0)
-        return df.mean(axis=axis)
+        numeric_only = options.get("numeric_only", False)
+        return df.mean(axis=axis, numeric_only=numeric_only)
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- result:any )",
         "Median values with optional axis",
         "DF.MEDIAN",
     )
-    async def DF_MEDIAN(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
+    def DF_MEDIAN(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
         """Median values.
 
         Options:
             axis: 0 for columns (default), 1 for rows
+            numeric_only: Only include numeric and bool columns (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series()
 
         axis = options.get("axis", 0)
-        return df.median(axis=axis)
+        numeric_only = options.get("numeric_only", False)
+        return df.median(axis=axis, numeric_only=numeric_only)
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- result:any )",
         "Count non-NA values with optional axis",
         "DF.COUNT",
     )
-    async def DF_COUNT(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
+    def DF_COUNT(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
         """Count non-NA values.
 
         Options:
             axis: 0 for columns (default), 1 for rows
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series()
 
         axis = options.get("axis", 0)
@@ -549,9 +1163,9 @@ DF>
         "Count unique values in Series",
         "DF.VALUE-COUNTS",
     )
-    async def DF_VALUE_COUNTS(self, series: pd.Series) -> pd.Series:
+    def DF_VALUE_COUNTS(self, series: pd.Series) -> pd.Series:
         """Count unique values in Series."""
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
         return series.value_counts()
@@ -561,13 +1175,13 @@ DF>
         "Create pivot table",
         "DF.PIVOT",
     )
-    async def DF_PIVOT(self, df: pd.DataFrame, values: str, index: str, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_PIVOT(self, df: pd.DataFrame, values: str, index: str, options: dict[str, Any]) -> pd.DataFrame:
         """Create pivot table.
 
         Options:
             columns: Column to use for pivot columns
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         columns = options.get("columns")
@@ -578,7 +1192,7 @@ DF>
         "Create advanced pivot table with aggregation",
         "DF.PIVOT-TABLE",
     )
-    async def DF_PIVOT_TABLE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_PIVOT_TABLE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Create advanced pivot table.
 
         Options:
@@ -587,7 +1201,7 @@ DF>
             columns: Column(s) for columns
             aggfunc: Aggregation function (default: 'mean')
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         values = options.get("values")
@@ -602,7 +1216,7 @@ DF>
         "Compute cross-tabulation of two factors",
         "DF.CROSSTAB",
     )
-    async def DF_CROSSTAB(self, index: Any, columns: Any, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_CROSSTAB(self, index: Any, columns: Any, options: dict[str, Any]) -> pd.DataFrame:
         """Compute cross-tabulation.
 
         Options:
@@ -620,16 +1234,23 @@ DF>
         "Compute correlation matrix",
         "DF.CORR",
     )
-    async def DF_CORR(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_CORR(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Compute pairwise correlation of columns.
 
         Options:
             method: 'pearson' (default), 'kendall', or 'spearman'
+            dtype: 'float32' computes Pearson with a single-precision matrix
+                product when the columns are numeric and have no missing values
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         method = options.get("method", "pearson")
+        dtype = options.get("dtype")
+        if dtype is not None and method == "pearson":
+            result = _gram_matrix(df, dtype, normalize=True)
+            if result is not None:
+                return result
         return df.corr(method=method)
 
     @WordDecorator(
@@ -637,11 +1258,21 @@ DF>
         "Compute covariance matrix",
         "DF.COV",
     )
-    async def DF_COV(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
-        """Compute pairwise covariance of columns."""
-        if df is None or df.empty:
+    def DF_COV(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+        """Compute pairwise covariance of columns.
+
+        Options:
+            dtype: 'float32' computes with a single-precision matrix product
+                when the columns are numeric and have no missing values
+        """
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
+        dtype = options.get("dtype")
+        if dtype is not None:
+            result = _gram_matrix(df, dtype, normalize=False)
+            if result is not None:
+                return result
         return df.cov()
 
     @WordDecorator(
@@ -649,13 +1280,13 @@ DF>
         "Create rolling window object",
         "DF.ROLLING",
     )
-    async def DF_ROLLING(self, df: pd.DataFrame, window: int, options: dict[str, Any]) -> Any:
+    def DF_ROLLING(self, df: pd.DataFrame, window: int, options: dict[str, Any]) -> Any:
         """Create rolling window object.
 
         Options:
             min_periods: Minimum number of observations in window
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return df.rolling(window=0)
 
         min_periods = options.get("min_periods")
@@ -666,13 +1297,13 @@ DF>
         "Cumulative sum",
         "DF.CUMSUM",
     )
-    async def DF_CUMSUM(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_CUMSUM(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Cumulative sum over DataFrame axis.
 
         Options:
             axis: 0 for columns (default), 1 for rows
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         axis = options.get("axis", 0)
@@ -683,13 +1314,13 @@ DF>
         "Cumulative product",
         "DF.CUMPROD",
     )
-    async def DF_CUMPROD(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_CUMPROD(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Cumulative product over DataFrame axis.
 
         Options:
             axis: 0 for columns (default), 1 for rows
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         axis = options.get("axis", 0)
@@ -700,14 +1331,14 @@ DF>
         "First discrete difference",
         "DF.DIFF",
     )
-    async def DF_DIFF(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_DIFF(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Calculate first discrete difference.
 
         Options:
             periods: Number of periods to shift (default: 1)
             axis: 0 for columns (default), 1 for rows
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         periods = options.get("periods", 1)
@@ -719,14 +1350,14 @@ DF>
         "Percentage change between current and prior element",
         "DF.PCT-CHANGE",
     )
-    async def DF_PCT_CHANGE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_PCT_CHANGE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Calculate percentage change.
 
         Options:
             periods: Number of periods to shift (default: 1)
             axis: 0 for columns (default), 1 for rows
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         periods = options.get("periods", 1)
@@ -738,21 +1369,23 @@ DF>
         "Rank values along axis",
         "DF.RANK",
     )
-    async def DF_RANK(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_RANK(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Compute numerical data ranks along axis.
 
         Options:
             method: 'average' (default), 'min', 'max', 'first', 'dense'
             ascending: True (default) or False
             axis: 0 for columns (default), 1 for rows
+            numeric_only: Only rank numeric and bool columns (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         method = options.get("method", "average")
         ascending = options.get("ascending", True)
         axis = options.get("axis", 0)
-        return df.rank(method=method, ascending=ascending, axis=axis)
+        numeric_only = options.get("numeric_only", False)
+        return df.rank(method=method, ascending=ascending, axis=axis, numeric_only=numeric_only)
 
     # ==================
     # Sorting & Filtering Operations
@@ -763,13 +1396,13 @@ DF>
         "Sort DataFrame by column(s)",
         "DF.SORT",
     )
-    async def DF_SORT(self, df: pd.DataFrame, by: Any, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_SORT(self, df: pd.DataFrame, by: Any, options: dict[str, Any]) -> pd.DataFrame:
         """Sort DataFrame by column(s).
 
         Options:
             ascending: True (default) or False, or list for multiple columns
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         ascending = options.get("ascending", True)
@@ -780,13 +1413,13 @@ DF>
         "Sort DataFrame by index",
         "DF.SORT-INDEX",
     )
-    async def DF_SORT_INDEX(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_SORT_INDEX(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Sort DataFrame by index.
 
         Options:
             ascending: True (default) or False
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         ascending = options.get("ascending", True)
@@ -797,12 +1430,12 @@ DF>
         "Query DataFrame with pandas expression",
         "DF.QUERY",
     )
-    async def DF_QUERY(self, df: pd.DataFrame, query_str: str) -> pd.DataFrame:
+    def DF_QUERY(self, df: pd.DataFrame, query_str: str) -> pd.DataFrame:
         """Query DataFrame using pandas expression string.
 
         Example: "age > 30 and city == 'NYC'"
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         return df.query(query_str)
@@ -812,9 +1445,9 @@ DF>
         "Filter rows where column value is in values list",
         "DF.ISIN",
     )
-    async def DF_ISIN(self, df: pd.DataFrame, column: str, values: list) -> pd.DataFrame:
+    def DF_ISIN(self, df: pd.DataFrame, column: str, values: list) -> pd.DataFrame:
         """Filter DataFrame to rows where column value is in values list."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         if column not in df.columns:
@@ -827,14 +1460,14 @@ DF>
         "Drop rows with NA values",
         "DF.DROPNA",
     )
-    async def DF_DROPNA(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_DROPNA(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Drop rows with NA values.
 
         Options:
             how: 'any' (default) or 'all'
             subset: List of column names to consider
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         how = options.get("how", "any")
@@ -846,13 +1479,13 @@ DF>
         "Fill NA values with specified value",
         "DF.FILLNA",
     )
-    async def DF_FILLNA(self, df: pd.DataFrame, value: Any, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_FILLNA(self, df: pd.DataFrame, value: Any, options: dict[str, Any]) -> pd.DataFrame:
         """Fill NA values with specified value.
 
         Options:
             method: 'ffill' or 'bfill' for forward/backward fill
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         method = options.get("method")
@@ -872,14 +1505,14 @@ DF>
         "Find duplicate rows",
         "DF.DUPLICATED",
     )
-    async def DF_DUPLICATED(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
+    def DF_DUPLICATED(self, df: pd.DataFrame, options: dict[str, Any]) -> Any:
         """Find duplicate rows.
 
         Options:
             subset: List of column names to consider
             keep: 'first' (default), 'last', or False
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.Series(dtype=bool)
 
         subset = options.get("subset")
@@ -903,8 +1536,21 @@ DF>
             header: Row number to use as column names (default: 0)
             index_col: Column to use as row labels
             dtype: Dict of column names to data types
+            engine: 'pyarrow' for the multithreaded Arrow reader (requires pyarrow)
+            memory_map: Parse straight from a memory-mapped file (default: True for local files)
+            dtype_backend: 'pyarrow' for Arrow-backed columns (requires pyarrow)
+            chunksize: Parse this many rows at a time, then combine into one DataFrame
         """
-        return pd.read_csv(filepath, **options)
+        if options.get("engine") == "pyarrow":
+            arrow_options = {k: v for k, v in options.items() if k != "engine"}
+            return await asyncio.to_thread(_read_csv_arrow, filepath, arrow_options)
+
+        # mmap needs a real, non-empty file; buffers and URLs are read as before
+        if "memory_map" not in options and isinstance(filepath, str) and os.path.isfile(filepath):
+            options = {"memory_map": os.path.getsize(filepath) > 0, **options}
+        if options.get("chunksize"):
+            return await asyncio.to_thread(_read_csv_chunked, filepath, options)
+        return await asyncio.to_thread(pd.read_csv, filepath, **options)
 
     @WordDecorator(
         "( filepath:str [options:WordOptions] -- df:DataFrame )",
@@ -919,7 +1565,7 @@ DF>
             header: Row number to use as column names (default: 0)
             index_col: Column to use as row labels
         """
-        return pd.read_excel(filepath, **options)
+        return await asyncio.to_thread(pd.read_excel, filepath, **options)
 
     @WordDecorator(
         "( filepath:str [options:WordOptions] -- df:DataFrame )",
@@ -932,7 +1578,21 @@ DF>
         Options:
             orient: 'records', 'index', 'columns', etc.
         """
-        return pd.read_json(filepath, **options)
+        return await asyncio.to_thread(pd.read_json, filepath, **options)
+
+    @WordDecorator(
+        "( filepath:str [options:WordOptions] -- df:DataFrame )",
+        "Read Parquet file into DataFrame",
+        "READ_PARQUET",
+    )
+    async def READ_PARQUET(self, filepath: str, options: dict[str, Any]) -> pd.DataFrame:
+        """Read Parquet file into DataFrame (requires pyarrow or fastparquet).
+
+        Options:
+            columns: Only read these columns
+            engine: 'auto' (default), 'pyarrow' or 'fastparquet'
+        """
+        return await asyncio.to_thread(pd.read_parquet, filepath, **options)
 
     @WordDecorator(
         "( df:DataFrame filepath:str [options:WordOptions] -- )",
@@ -950,7 +1610,7 @@ DF>
         if df is None:
             df = pd.DataFrame()
 
-        df.to_csv(filepath, **options)
+        await asyncio.to_thread(df.to_csv, filepath, **options)
 
     @WordDecorator(
         "( df:DataFrame filepath:str [options:WordOptions] -- )",
@@ -967,7 +1627,7 @@ DF>
         if df is None:
             df = pd.DataFrame()
 
-        df.to_excel(filepath, **options)
+        await asyncio.to_thread(df.to_excel, filepath, **options)
 
     @WordDecorator(
         "( df:DataFrame filepath:str [options:WordOptions] -- )",
@@ -984,37 +1644,96 @@ DF>
         if df is None:
             df = pd.DataFrame()
 
-        df.to_json(filepath, **options)
+        await asyncio.to_thread(df.to_json, filepath, **options)
+
+    @WordDecorator(
+        "( df:DataFrame filepath:str [options:WordOptions] -- )",
+        "Write DataFrame to Parquet file",
+        "TO_PARQUET",
+    )
+    async def TO_PARQUET(self, df: pd.DataFrame, filepath: str, options: dict[str, Any]) -> None:
+        """Write DataFrame to Parquet file (requires pyarrow or fastparquet).
+
+        Parquet keeps column types and is much smaller and faster to read back
+        than CSV or Excel, so it suits intermediate results.
+
+        Options:
+            compression: 'zstd' (default), 'snappy', 'gzip' or None
+            index: Whether to write row index (default: stored only if not a RangeIndex)
+        """
+        if df is None:
+            df = pd.DataFrame()
+
+        options = {"compression": "zstd", **options}
+        await asyncio.to_thread(df.to_parquet, filepath, **options)
 
     # ==================
     # Transformation Operations
     # ==================
 
-    @ForthicDirectWord("( df:DataFrame forthic:str -- df:DataFrame )", "Map Forthic over DataFrame elements", "DF.MAP")
+    @ForthicDirectWord(
+        "( df:DataFrame forthic:str [options:WordOptions] -- df:DataFrame )",
+        "Map Forthic over DataFrame elements",
+        "DF.MAP",
+    )
     async def DF_MAP(self, interp) -> None:
         """Map Forthic code over all elements in DataFrame.
 
         The Forthic code receives each element value on the stack and should
         leave a transformed value on the stack.
+
+        Options:
+            batched: Run the code once per column on a list of its values; it
+                should leave a list of the same length (default: False)
         """
+        options = {}
+        if len(interp.get_stack()) > 0:
+            top = interp.stack_peek()
+            from ..word_options import WordOptions
+            if isinstance(top, WordOptions):
+                opts = interp.stack_pop()
+                options = opts.to_dict()
+
         forthic = interp.stack_pop()
         df = interp.stack_pop()
 
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             interp.stack_push(pd.DataFrame())
             return
 
         string_location = interp.get_string_location()
-        result = df.copy()
-
-        for col in result.columns:
-            new_values = []
-            for value in result[col]:
+        batched = options.get("batched", False)
+        # Collect every new column by position and build the frame once at the end
+        new_columns = {}
+
+        for j in range(len(df.columns)):
+            series = df.iloc[:, j]
+            if batched:
+                interp.stack_push(series.tolist())
+                await interp.run(forthic, string_location)
+                values = interp.stack_pop()
+                if isinstance(values, pd.Series):
+                    values = values.to_numpy()
+                if not isinstance(values, (list, tuple, np.ndarray)) or len(values) != len(series):
+                    got = type(values).__name__
+                    if hasattr(values, "__len__"):
+                        got += f" of length {len(values)}"
+                    raise ValueError(
+                        f"DF.MAP code must return {len(series)} values for each column "
+                        f"when batched, got {got}"
+                    )
+                new_columns[j] = pd.Series(values, index=df.index)
+                continue
+
+            new_values = np.empty(len(series), dtype=object)
+            for i, value in enumerate(series):
                 interp.stack_push(value)
                 await interp.run(forthic, string_location)
-                new_values.append(interp.stack_pop())
-            result[col] = new_values
+                new_values[i] = interp.stack_pop()
+            new_columns[j] = pd.Series(new_values, index=df.index).infer_objects()
 
+        result = pd.DataFrame(new_columns, index=df.index)
+        result.columns = df.columns
         interp.stack_push(result)
 
     @ForthicDirectWord(
@@ -1043,7 +1762,7 @@ DF>
         forthic = interp.stack_pop()
         df = interp.stack_pop()
 
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             interp.stack_push(pd.DataFrame())
             return
 
@@ -1052,9 +1771,8 @@ DF>
         result = []
 
         if axis == 1:  # Apply to rows
-            for _, row in df.iterrows():
-                row_dict = row.to_dict()
-                interp.stack_push(row_dict)
+            for record in _row_records(df):
+                interp.stack_push(record)
                 await interp.run(forthic, string_location)
                 result.append(interp.stack_pop())
         else:  # Apply to columns
@@ -1067,67 +1785,100 @@ DF>
         interp.stack_push(pd.Series(result))
 
     @WordDecorator(
-        "( df:DataFrame func_name:str [options:WordOptions] -- df:DataFrame )",
+        "( df_or_grouped:any func_name:str [options:WordOptions] -- df:DataFrame )",
         "Transform with function name",
         "DF.TRANSFORM",
     )
-    async def DF_TRANSFORM(self, df: pd.DataFrame, func_name: str, options: dict[str, Any]) -> pd.DataFrame:
-        """Transform DataFrame with function name.
+    def DF_TRANSFORM(self, obj: Any, func_name: str, options: dict[str, Any]) -> pd.DataFrame:
+        """Transform DataFrame (or GroupBy) with function name.
+
+        On a GroupBy, reductions like 'sum' broadcast each group's result back
+        to its rows.
 
         Options:
-            axis: 0 for columns (default), 1 for rows
+            axis: 0 for columns (default), 1 for rows (DataFrame only)
+            engine: 'numba' (requires numba) or 'cython' for grouped sum, mean,
+                std, var, min and max
+            engine_kwargs: dict passed to the engine (numba default:
+                nopython, nogil and parallel all true)
         """
-        if df is None or df.empty:
+        if isinstance(obj, pd.core.groupby.GroupBy):
+            engine = options.get("engine")
+            if engine is None:
+                return obj.transform(func_name)
+            engine_kwargs = _check_engine(obj, func_name, engine, options.get("engine_kwargs"))
+            return obj.transform(func_name, engine=engine, engine_kwargs=engine_kwargs)
+
+        if _is_none_or_empty(obj):
             return pd.DataFrame()
 
+        if options.get("engine") is not None:
+            _check_engine(obj, func_name, options["engine"], None)
+
         axis = options.get("axis", 0)
-        return df.transform(func_name, axis=axis)
+        return obj.transform(func_name, axis=axis)
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- df:DataFrame )",
         "Reset DataFrame index",
         "DF.RESET-INDEX",
     )
-    async def DF_RESET_INDEX(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_RESET_INDEX(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Reset DataFrame index.
 
         Options:
             drop: Whether to drop the old index (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         drop = options.get("drop", False)
-        return df.reset_index(drop=drop)
+        if not drop:
+            return df.reset_index()
+
+        # Only the index changes, so a shallow copy avoids copying every column
+        result = df.copy(deep=False)
+        result.index = pd.RangeIndex(len(df))
+        return result
 
     @WordDecorator(
         "( df:DataFrame column:str [options:WordOptions] -- df:DataFrame )",
         "Set column as index",
         "DF.SET-INDEX",
     )
-    async def DF_SET_INDEX(self, df: pd.DataFrame, column: str, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_SET_INDEX(self, df: pd.DataFrame, column: str, options: dict[str, Any]) -> pd.DataFrame:
         """Set column as index.
 
         Options:
             drop: Whether to drop the column (default: True)
+            verify_integrity: Raise if the new index has duplicates (default: False)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         if column not in df.columns:
             raise KeyError(f"Column '{column}' not found in DataFrame")
 
         drop = options.get("drop", True)
-        return df.set_index(column, drop=drop)
+        verify_integrity = options.get("verify_integrity", False)
+        if verify_integrity or not df.columns.is_unique or isinstance(df.columns, pd.MultiIndex):
+            return df.set_index(column, drop=drop, verify_integrity=verify_integrity)
+
+        # set_index copies every column; moving one column into the index
+        # of a shallow copy leaves the others shared
+        result = df.copy(deep=False)
+        index = result.pop(column) if drop else result[column]
+        result.index = pd.Index(index)
+        return result
 
     @WordDecorator(
         "( df:DataFrame [options:WordOptions] -- df:DataFrame )",
         "Transpose DataFrame",
         "DF.TRANSPOSE",
     )
-    async def DF_TRANSPOSE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_TRANSPOSE(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Transpose DataFrame (swap rows and columns)."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         return df.transpose()
@@ -1137,7 +1888,7 @@ DF>
         "Unpivot DataFrame from wide to long format",
         "DF.MELT",
     )
-    async def DF_MELT(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_MELT(self, df: pd.DataFrame, options: dict[str, Any]) -> pd.DataFrame:
         """Unpivot DataFrame from wide to long format.
 
         Options:
@@ -1146,7 +1897,7 @@ DF>
             var_name: Name for variable column (default: 'variable')
             value_name: Name for value column (default: 'value')
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         id_vars = options.get("id_vars")
@@ -1162,22 +1913,30 @@ DF>
         "Explode list-like values into separate rows",
         "DF.EXPLODE",
     )
-    async def DF_EXPLODE(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+    def DF_EXPLODE(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
         """Explode list-like values in column into separate rows."""
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         if column not in df.columns:
             raise KeyError(f"Column '{column}' not found in DataFrame")
 
-        return df.explode(column)
+        if not df.columns.is_unique:
+            return df.explode(column)
+
+        # Exploding over a RangeIndex gives each output row's source position, so
+        # the other columns can be repeated with one take() instead of a join
+        exploded = df[column].reset_index(drop=True).explode()
+        result = df.take(exploded.index)
+        result.isetitem(df.columns.get_loc(column), exploded.array)
+        return result
 
     @WordDecorator(
         "( df:DataFrame to_replace:any value:any [options:WordOptions] -- df:DataFrame )",
         "Replace values in DataFrame",
         "DF.REPLACE",
     )
-    async def DF_REPLACE(self, df: pd.DataFrame, to_replace: Any, value: Any,
+    def DF_REPLACE(self, df: pd.DataFrame, to_replace: Any, value: Any,
                         options: dict[str, Any]) -> pd.DataFrame:
         """Replace values in DataFrame.
 
@@ -1185,7 +1944,7 @@ DF>
             to_replace: Value(s) to replace
             value: Replacement value(s)
         """
-        if df is None or df.empty:
+        if _is_none_or_empty(df):
             return pd.DataFrame()
 
         return df.replace(to_replace, value)
@@ -1199,7 +1958,7 @@ DF>
         "Merge two DataFrames",
         "DF.MERGE",
     )
-    async def DF_MERGE(self, left: pd.DataFrame, right: pd.DataFrame,
+    def DF_MERGE(self, left: pd.DataFrame, right: pd.DataFrame,
                       options: dict[str, Any]) -> pd.DataFrame:
         """Merge two DataFrames.
 
@@ -1222,7 +1981,7 @@ DF>
         "Join DataFrames on index",
         "DF.JOIN",
     )
-    async def DF_JOIN(self, left: pd.DataFrame, right: pd.DataFrame,
+    def DF_JOIN(self, left: pd.DataFrame, right: pd.DataFrame,
                      options: dict[str, Any]) -> pd.DataFrame:
         """Join DataFrames on index.
 
@@ -1243,7 +2002,7 @@ DF>
         "Concatenate DataFrames",
         "DF.CONCAT",
     )
-    async def DF_CONCAT(self, dfs: list, options: dict[str, Any]) -> pd.DataFrame:
+    def DF_CONCAT(self, dfs: list, options: dict[str, Any]) -> pd.DataFrame:
         """Concatenate list of DataFrames.
 
         Options:
@@ -1261,47 +2020,51 @@ DF>
     # ==================
 
     @WordDecorator("( series:Series -- series:Series )", "Convert strings to uppercase", "STR.UPPER")
-    async def STR_UPPER(self, series: pd.Series) -> pd.Series:
+    def STR_UPPER(self, series: pd.Series) -> pd.Series:
         """Convert strings in Series to uppercase."""
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
-        return series.str.upper()
+        return _str_method(series, "upper")
 
     @WordDecorator("( series:Series -- series:Series )", "Convert strings to lowercase", "STR.LOWER")
-    async def STR_LOWER(self, series: pd.Series) -> pd.Series:
+    def STR_LOWER(self, series: pd.Series) -> pd.Series:
         """Convert strings in Series to lowercase."""
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
-        return series.str.lower()
+        return _str_method(series, "lower")
 
     @WordDecorator("( series:Series -- series:Series )", "Strip whitespace from strings", "STR.STRIP")
-    async def STR_STRIP(self, series: pd.Series) -> pd.Series:
+    def STR_STRIP(self, series: pd.Series) -> pd.Series:
         """Strip leading and trailing whitespace from strings."""
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
-        return series.str.strip()
+        return _str_method(series, "strip")
 
     @WordDecorator(
         "( series:Series pattern:str [options:WordOptions] -- series:Series )",
         "Check if strings contain pattern",
         "STR.CONTAINS",
     )
-    async def STR_CONTAINS(self, series: pd.Series, pattern: str, options: dict[str, Any]) -> pd.Series:
+    def STR_CONTAINS(self, series: pd.Series, pattern: str, options: dict[str, Any]) -> pd.Series:
         """Check if strings contain pattern (supports regex).
 
         Options:
             case: Whether to be case sensitive (default: True)
             regex: Whether pattern is regex (default: True)
         """
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
         case = options.get("case", True)
         regex = options.get("regex", True)
 
+        # Substring checks are much cheaper than running a compiled regex per cell
+        if regex and case and _is_literal_pattern(pattern):
+            regex = False
+
         return series.str.contains(pattern, case=case, regex=regex, na=False)
 
     @WordDecorator(
@@ -1309,13 +2072,13 @@ DF>
         "Split strings by separator",
         "STR.SPLIT",
     )
-    async def STR_SPLIT(self, series: pd.Series, sep: str, options: dict[str, Any]) -> pd.Series:
+    def STR_SPLIT(self, series: pd.Series, sep: str, options: dict[str, Any]) -> pd.Series:
         """Split strings by separator.
 
         Options:
             expand: Whether to expand into separate columns (default: False)
         """
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
         expand = options.get("expand", False)
@@ -1326,17 +2089,21 @@ DF>
         "Replace substring in strings",
         "STR.REPLACE",
     )
-    async def STR_REPLACE(self, series: pd.Series, pat: str, repl: str,
+    def STR_REPLACE(self, series: pd.Series, pat: str, repl: str,
                          options: dict[str, Any]) -> pd.Series:
         """Replace substring in strings.
 
         Options:
             regex: Whether pattern is regex (default: True)
         """
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.Series()
 
         regex = options.get("regex", True)
+        # Backslashes in repl are group references/escapes only in regex mode
+        if regex and _is_literal_pattern(pat) and isinstance(repl, str) and "\\" not in repl:
+            regex = False
+
         return series.str.replace(pat, repl, regex=regex)
 
     @WordDecorator(
@@ -1344,7 +2111,7 @@ DF>
         "Extract regex pattern from strings",
         "STR.EXTRACT",
     )
-    async def STR_EXTRACT(self, series: pd.Series, pattern: str, options: dict[str, Any]) -> pd.DataFrame:
+    def STR_EXTRACT(self, series: pd.Series, pattern: str, options: dict[str, Any]) -> pd.DataFrame:
         """Extract regex pattern from strings into DataFrame.
 
         The pattern should have capture groups which become columns.
@@ -1352,7 +2119,7 @@ DF>
         Options:
             expand: Whether to expand into DataFrame (default: True)
         """
-        if series is None or series.empty:
+        if _is_none_or_empty(series):
             return pd.DataFrame()
 
         expand = options.get("expand", True)
@@ -5,7 +5,9 @@ Provides array manipulation including mapping, filtering, and grouping.
 
 from __future__ import annotations
 
+import heapq
 import random
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -15,6 +17,32 @@ from ...decorators import DecoratedModule, ForthicDirectWord, register_module_do
 from ...decorators import ForthicWord as WordDecorator
 
 
+def _membership(items: list) -> Callable[[Any], bool]:
+    """Build an `item in items` test that hashes whatever it can.
+
+    Hashable items go into a set for O(1) lookups; unhashable ones (e.g.
+    records) are kept aside and still compared with a list scan, so the
+    result always matches `item in items`.
+    """
+    hashable: set = set()
+    unhashable: list = []
+    for item in items:
+        try:
+            hashable.add(item)
+        except TypeError:
+            unhashable.append(item)
+
+    def contains(item: Any) -> bool:
+        try:
+            if item in hashable:
+                return True
+        except TypeError:
+            return item in items
+        return bool(unhashable) and item in unhashable
+
+    return contains
+
+
 class ArrayModule(DecoratedModule):
     """Array and collection operations for manipulating arrays and records."""
 
@@ -82,11 +110,11 @@ Several words support options via the ~> operator using syntax: [.option_name va
             else:
                 interp.stack_push(container[n])
         else:
-            keys = sorted(container.keys())
-            if n < 0 or n >= len(keys):
+            if n < 0 or n >= len(container):
                 interp.stack_push(None)
             else:
-                key = keys[n]
+                # Only the n+1 smallest keys are needed, not a full sort
+                key = heapq.nsmallest(n + 1, container)[-1]
                 interp.stack_push(container[key])
 
     @WordDecorator("( container:any -- item:any )", "Get last element from array or record")
@@ -99,10 +127,9 @@ Several words support options via the ~> operator using syntax: [.option_name va
                 return None
             return container[-1]
         else:
-            keys = sorted(container.keys())
-            if len(keys) == 0:
+            if len(container) == 0:
                 return None
-            return container[keys[-1]]
+            return container[max(container)]
 
     @WordDecorator("( container:any start:number end:number -- result:any )", "Extract slice from array or record")
     async def SLICE(self, container: Any, start: int, end: int) -> Any:
@@ -124,36 +151,24 @@ Several words support options via the ~> operator using syntax: [.option_name va
         start = normalize_index(start)
         end = normalize_index(end)
 
-        step = -1 if start > end else 1
-        indexes: list[int | None] = [start]
-
         if start < 0 or start >= length:
             # Return empty result
             return [] if isinstance(_container, list) else {}
 
-        while start != end:
-            start = start + step
-            if start < 0 or start >= length:
-                indexes.append(None)
-            else:
-                indexes.append(start)
+        step = -1 if start > end else 1
+        indexes = range(start, end + step, step)
 
         if isinstance(_container, list):
-            result: list = []
-            for i in indexes:
-                if i is None:
-                    result.append(None)
-                else:
-                    result.append(_container[i])
-            return result
+            if 0 <= end < length:
+                # Both ends in range: a plain slice, reversed when counting down
+                if step == 1:
+                    return _container[start : end + 1]
+                return _container[end : start + 1][::-1]
+            # Positions past either end are padded with None
+            return [_container[i] if 0 <= i < length else None for i in indexes]
         else:
             keys = sorted(_container.keys())
-            result_dict: dict = {}
-            for i in indexes:
-                if i is not None:
-                    k = keys[i]
-                    result_dict[k] = _container[k]
-            return result_dict
+            return {keys[i]: _container[keys[i]] for i in indexes if 0 <= i < length}
 
     @WordDecorator("( container:any[] n:number [options:WordOptions] -- result:any[] )", "Take first n elements")
     async def TAKE(self, container: list, n: int, options: dict[str, Any]) -> list:
@@ -338,10 +353,7 @@ Several words support options via the ~> operator using syntax: [.option_name va
 
         if isinstance(container, list):
             if len(container) > 0:
-                result = container.copy()
-                val = result.pop()
-                result.insert(0, val)
-                return result
+                return container[-1:] + container[:-1]
 
         return container
 
@@ -501,11 +513,8 @@ Several words support options via the ~> operator using syntax: [.option_name va
         _rcontainer = rcontainer if rcontainer is not None else []
 
         def difference(l: list, r: list) -> list:
-            res = []
-            for item in l:
-                if item not in r:
-                    res.append(item)
-            return res
+            in_r = _membership(r)
+            return [item for item in l if not in_r(item)]
 
         if isinstance(_rcontainer, list):
             return difference(_lcontainer, _rcontainer)
@@ -524,11 +533,8 @@ Several words support options via the ~> operator using syntax: [.option_name va
         _rcontainer = rcontainer if rcontainer is not None else []
 
         def intersection(l: list, r: list) -> list:
-            res = []
-            for item in l:
-                if item in r:
-                    res.append(item)
-            return res
+            in_r = _membership(r)
+            return [item for item in l if in_r(item)]
 
         if isinstance(_rcontainer, list):
             return intersection(_lcontainer, _rcontainer)
@@ -549,12 +555,8 @@ Several words support options via the ~> operator using syntax: [.option_name va
             rcontainer = []
 
         def union(l: list, r: list) -> list:
-            keyset: dict = {}
-            for item in l:
-                keyset[item] = True
-            for item in r:
-                keyset[item] = True
-            return list(keyset.keys())
+            # dict keeps first-seen order, unlike set
+            return list(dict.fromkeys([*l, *r]))
 
         if isinstance(rcontainer, list):
             result = union(lcontainer, rcontainer)
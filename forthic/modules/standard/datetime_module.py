@@ -23,14 +23,74 @@ from __future__ import annotations
 
 import re
 from datetime import date, datetime, time, timedelta, timezone
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 from zoneinfo import ZoneInfo
 
 from ...decorators import ForthicDirectWord, ForthicWord, DecoratedModule, register_module_doc
 
+# numpy is optional: it only speeds up date math over arrays
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from ...interpreter import Interpreter
 
+_AMPM_RE = re.compile(r"^(\d{1,2}):(\d{2})\s*(AM|PM)$", re.IGNORECASE)
+
+
+def _as_date(item: Any) -> date | None:
+    """Return item as a date (datetimes are truncated), or None if it isn't one."""
+    if isinstance(item, datetime):
+        return item.date()
+    if isinstance(item, date):
+        return item
+    return None
+
+
+def _add_days_to_dates(items: list[Any], num_days: Any) -> list[date | None]:
+    """Add num_days to each date in items; non-dates map to None."""
+    dates = [_as_date(item) for item in items]
+    if np is not None and type(num_days) is int and dates and None not in dates:
+        shifted = np.array(dates, dtype="datetime64[D]") + np.timedelta64(num_days, "D")
+        return cast("list[date | None]", shifted.astype(object).tolist())
+
+    delta = timedelta(days=num_days)
+    return [None if d is None else d + delta for d in dates]
+
+
+def _may_be_iso_date(s: str) -> bool:
+    """Cheap shape check run before fromisoformat: every ISO date form Python
+    accepts (YYYY-MM-DD, YYYYMMDD, YYYYWww, ...) starts with a 4-digit year and
+    is at least 7 characters long."""
+    return len(s) >= 7 and s[:4].isdigit()
+
+
+@lru_cache(maxsize=4096)
+def _date_to_str(d: date) -> str:
+    return d.isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _date_to_int(d: date) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def _subtract_date_lists(items1: list[Any], items2: list[Any]) -> list[int | None]:
+    """Element-wise day differences (items1 - items2); non-dates map to None."""
+    dates1 = [_as_date(item) for item in items1]
+    dates2 = [_as_date(item) for item in items2]
+    if np is not None and dates1 and None not in dates1 and None not in dates2:
+        deltas = np.array(dates1, dtype="datetime64[D]") - np.array(dates2, dtype="datetime64[D]")
+        return cast("list[int | None]", deltas.astype("int64").tolist())
+
+    return [
+        None if d1 is None or d2 is None else (d1 - d2).days
+        for d1, d2 in zip(dates1, dates2, strict=True)
+    ]
+
 
 class DateTimeModule(DecoratedModule):
     """DateTime module for Forthic."""
@@ -61,21 +121,21 @@ TODAY 7 ADD-DAYS
         )
 
     @ForthicDirectWord("( -- date )", "Get current date", "TODAY")
-    async def TODAY(self, interp: Interpreter) -> None:
+    def TODAY(self, interp: Interpreter) -> None:
         """Get current date in interpreter's timezone."""
         tz = interp.get_timezone()
         today = datetime.now(tz).date()
         interp.stack_push(today)
 
     @ForthicDirectWord("( -- datetime )", "Get current datetime", "NOW")
-    async def NOW(self, interp: Interpreter) -> None:
+    def NOW(self, interp: Interpreter) -> None:
         """Get current datetime in interpreter's timezone."""
         tz = interp.get_timezone()
         now = datetime.now(tz)
         interp.stack_push(now)
 
     @ForthicDirectWord("( time -- time )", "Convert time to AM (subtract 12 from hour if >= 12)")
-    async def AM(self, interp: Interpreter) -> None:
+    def AM(self, interp: Interpreter) -> None:
         """Convert time to AM."""
         t = interp.stack_pop()
 
@@ -91,7 +151,7 @@ TODAY 7 ADD-DAYS
             interp.stack_push(t)
 
     @ForthicDirectWord("( time -- time )", "Convert time to PM (add 12 to hour if < 12)")
-    async def PM(self, interp: Interpreter) -> None:
+    def PM(self, interp: Interpreter) -> None:
         """Convert time to PM."""
         t = interp.stack_pop()
 
@@ -107,7 +167,7 @@ TODAY 7 ADD-DAYS
             interp.stack_push(t)
 
     @ForthicDirectWord("( item -- time )", "Convert string or datetime to time", ">TIME")
-    async def to_TIME(self, interp: Interpreter) -> None:
+    def to_TIME(self, interp: Interpreter) -> None:
         """Convert item to time object."""
         item = interp.stack_pop()
 
@@ -126,10 +186,10 @@ TODAY 7 ADD-DAYS
             return
 
         # Otherwise, parse as string
-        str_val = str(item).strip()
+        str_val = item.strip() if type(item) is str else str(item).strip()
 
         # Handle "HH:MM AM/PM" format
-        ampm_match = re.match(r"^(\d{1,2}):(\d{2})\s*(AM|PM)$", str_val, re.IGNORECASE)
+        ampm_match = _AMPM_RE.match(str_val)
         if ampm_match:
             hour = int(ampm_match.group(1))
             minute = int(ampm_match.group(2))
@@ -143,6 +203,17 @@ TODAY 7 ADD-DAYS
             interp.stack_push(time(hour=hour, minute=minute))
             return
 
+        # Fast path for zero-padded HH:MM and HH:MM:SS (parsed in C)
+        str_len = len(str_val)
+        if (str_len == 5 and str_val[2] == ":") or (
+            str_len == 8 and str_val[2] == ":" and str_val[5] == ":"
+        ):
+            try:
+                interp.stack_push(time.fromisoformat(str_val))
+                return
+            except ValueError:
+                pass
+
         # Try standard time parsing (HH:MM or HH:MM:SS)
         try:
             # Try HH:MM:SS format
@@ -160,7 +231,7 @@ TODAY 7 ADD-DAYS
         interp.stack_push(None)
 
     @ForthicDirectWord("( item -- date )", "Convert string or datetime to date", ">DATE")
-    async def to_DATE(self, interp: Interpreter) -> None:
+    def to_DATE(self, interp: Interpreter) -> None:
         """Convert item to date object."""
         item = interp.stack_pop()
 
@@ -179,14 +250,15 @@ TODAY 7 ADD-DAYS
             return
 
         # Otherwise, parse as string
-        str_val = str(item).strip()
+        str_val = item.strip() if type(item) is str else str(item).strip()
 
         # Try standard ISO format (YYYY-MM-DD)
-        try:
-            interp.stack_push(date.fromisoformat(str_val))
-            return
-        except (ValueError, TypeError):
-            pass
+        if _may_be_iso_date(str_val):
+            try:
+                interp.stack_push(date.fromisoformat(str_val))
+                return
+            except (ValueError, TypeError):
+                pass
 
         # Try parsing as a more flexible format using dateutil if available
         try:
@@ -200,10 +272,9 @@ TODAY 7 ADD-DAYS
         interp.stack_push(None)
 
     @ForthicDirectWord("( str_or_timestamp -- datetime )", "Convert string or timestamp to datetime", ">DATETIME")
-    async def to_DATETIME(self, interp: Interpreter) -> None:
+    def to_DATETIME(self, interp: Interpreter) -> None:
         """Convert item to datetime object."""
         item = interp.stack_pop()
-        tz = interp.get_timezone()
 
         if item is None:
             interp.stack_push(None)
@@ -213,57 +284,54 @@ TODAY 7 ADD-DAYS
         if isinstance(item, datetime):
             if item.tzinfo is None:
                 # Assume it's in the interpreter's timezone
-                interp.stack_push(item.replace(tzinfo=tz))
+                interp.stack_push(item.replace(tzinfo=interp.get_timezone()))
             else:
                 interp.stack_push(item)
             return
 
         # If it's a number, treat as Unix timestamp (seconds)
         if isinstance(item, (int, float)):
-            dt = datetime.fromtimestamp(item, tz=tz)
+            dt = datetime.fromtimestamp(item, tz=interp.get_timezone())
             interp.stack_push(dt)
             return
 
         # Otherwise, parse as string
-        str_val = str(item).strip()
+        str_val = item.strip() if type(item) is str else str(item).strip()
+        if not _may_be_iso_date(str_val):
+            interp.stack_push(None)
+            return
 
         try:
             # Try parsing as ISO datetime string
             dt = datetime.fromisoformat(str_val)
             # If no timezone info, assume interpreter's timezone
             if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=tz)
+                dt = dt.replace(tzinfo=interp.get_timezone())
             interp.stack_push(dt)
         except (ValueError, TypeError):
             interp.stack_push(None)
 
     @ForthicDirectWord("( date time -- datetime )", "Combine date and time into datetime", "AT")
-    async def AT(self, interp: Interpreter) -> None:
+    def AT(self, interp: Interpreter) -> None:
         """Combine date and time into datetime."""
         t = interp.stack_pop()
         d = interp.stack_pop()
-        tz = interp.get_timezone()
 
         if d is None or t is None:
             interp.stack_push(None)
             return
 
         # Create datetime from date and time components
-        dt = datetime(
-            year=d.year,
-            month=d.month,
-            day=d.day,
-            hour=getattr(t, "hour", 0),
-            minute=getattr(t, "minute", 0),
-            second=getattr(t, "second", 0),
-            microsecond=getattr(t, "microsecond", 0),
-            tzinfo=tz,
-        )
+        if isinstance(t, (time, datetime)):
+            hh, mm, ss, us = t.hour, t.minute, t.second, t.microsecond
+        else:
+            hh = mm = ss = us = 0
+        dt = datetime(d.year, d.month, d.day, hh, mm, ss, us, tzinfo=interp.get_timezone())
 
         interp.stack_push(dt)
 
     @ForthicWord("( time -- str )", "Convert time to HH:MM string", "TIME>STR")
-    async def TIME_to_STR(self, t: Any) -> str:
+    def TIME_to_STR(self, t: Any) -> str:
         """Convert time to string."""
         if t is None or not isinstance(t, time):
             return ""
@@ -271,7 +339,7 @@ TODAY 7 ADD-DAYS
         return f"{t.hour:02d}:{t.minute:02d}"
 
     @ForthicWord("( date -- str )", "Convert date to YYYY-MM-DD string", "DATE>STR")
-    async def DATE_to_STR(self, d: Any) -> str:
+    def DATE_to_STR(self, d: Any) -> str:
         """Convert date to string."""
         if d is None:
             return ""
@@ -283,10 +351,10 @@ TODAY 7 ADD-DAYS
         if not isinstance(d, date):
             return ""
 
-        return d.isoformat()
+        return _date_to_str(d)
 
     @ForthicWord("( date -- int )", "Convert date to integer (YYYYMMDD)", "DATE>INT")
-    async def DATE_to_INT(self, d: Any) -> Any:
+    def DATE_to_INT(self, d: Any) -> Any:
         """Convert date to integer."""
         if d is None:
             return None
@@ -298,10 +366,10 @@ TODAY 7 ADD-DAYS
         if not isinstance(d, date):
             return None
 
-        return d.year * 10000 + d.month * 100 + d.day
+        return _date_to_int(d)
 
     @ForthicDirectWord("( datetime -- timestamp )", "Convert datetime to Unix timestamp (seconds)", ">TIMESTAMP")
-    async def to_TIMESTAMP(self, interp: Interpreter) -> None:
+    def to_TIMESTAMP(self, interp: Interpreter) -> None:
         """Convert datetime to Unix timestamp."""
         dt = interp.stack_pop()
 
@@ -323,22 +391,21 @@ TODAY 7 ADD-DAYS
         interp.stack_push(timestamp)
 
     @ForthicDirectWord("( timestamp -- datetime )", "Convert Unix timestamp (seconds) to datetime", "TIMESTAMP>DATETIME")
-    async def TIMESTAMP_to_DATETIME(self, interp: Interpreter) -> None:
+    def TIMESTAMP_to_DATETIME(self, interp: Interpreter) -> None:
         """Convert Unix timestamp to datetime."""
         timestamp = interp.stack_pop()
-        tz = interp.get_timezone()
 
         if timestamp is None or not isinstance(timestamp, (int, float)):
             interp.stack_push(None)
             return
 
         # Convert from Unix timestamp (seconds)
-        dt = datetime.fromtimestamp(timestamp, tz=tz)
+        dt = datetime.fromtimestamp(timestamp, tz=interp.get_timezone())
         interp.stack_push(dt)
 
-    @ForthicDirectWord("( date num_days -- date )", "Add days to a date", "ADD-DAYS")
-    async def ADD_DAYS(self, interp: Interpreter) -> None:
-        """Add days to a date."""
+    @ForthicDirectWord("( date num_days -- date )", "Add days to a date (or to each date in an array)", "ADD-DAYS")
+    def ADD_DAYS(self, interp: Interpreter) -> None:
+        """Add days to a date, or to each date in an array."""
         num_days = interp.stack_pop()
         d = interp.stack_pop()
 
@@ -346,6 +413,10 @@ TODAY 7 ADD-DAYS
             interp.stack_push(None)
             return
 
+        if isinstance(d, list):
+            interp.stack_push(_add_days_to_dates(d, num_days))
+            return
+
         # Handle datetime objects
         if isinstance(d, datetime):
             result = d + timedelta(days=num_days)
@@ -358,9 +429,9 @@ TODAY 7 ADD-DAYS
 
         interp.stack_push(d + timedelta(days=num_days))
 
-    @ForthicDirectWord("( date1 date2 -- num_days )", "Get difference in days between dates (date1 - date2)", "SUBTRACT-DATES")
-    async def SUBTRACT_DATES(self, interp: Interpreter) -> None:
-        """Calculate difference in days between two dates."""
+    @ForthicDirectWord("( date1 date2 -- num_days )", "Get difference in days between dates (date1 - date2), element-wise for arrays", "SUBTRACT-DATES")
+    def SUBTRACT_DATES(self, interp: Interpreter) -> None:
+        """Calculate difference in days between two dates (or two equal-length date arrays)."""
         date2 = interp.stack_pop()
         date1 = interp.stack_pop()
 
@@ -368,6 +439,13 @@ TODAY 7 ADD-DAYS
             interp.stack_push(None)
             return
 
+        if isinstance(date1, list) and isinstance(date2, list):
+            if len(date1) != len(date2):
+                interp.stack_push(None)
+                return
+            interp.stack_push(_subtract_date_lists(date1, date2))
+            return
+
         # Handle datetime objects
         if isinstance(date1, datetime):
             date1 = date1.date()
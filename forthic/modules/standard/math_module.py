@@ -5,8 +5,21 @@ Provides arithmetic, comparison, and mathematical utility functions.
 
 from __future__ import annotations
 
-import math
-from typing import TYPE_CHECKING, Any
+import operator
+import random
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache
+from math import ceil as _ceil
+from math import e as _e
+from math import floor as _floor
+from math import inf as _inf
+from math import pi as _pi
+from math import prod as _prod
+from math import sqrt as _sqrt
+from math import trunc as _trunc
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from ...interpreter import Interpreter
@@ -14,6 +27,33 @@ if TYPE_CHECKING:
 from ...decorators import DecoratedModule, ForthicDirectWord, register_module_doc
 from ...decorators import ForthicWord as WordDecorator
 
+# Bound method of the module-level Random instance, so random.seed() still applies
+_random = random.random
+
+
+def _sum_numbers(numbers: list) -> Any:
+    """Sum an array, skipping None entries."""
+    # `None in` and sum() both loop in C; only filter when there is something to skip
+    if None not in numbers:
+        return sum(numbers)
+    return sum(num for num in numbers if num is not None)
+
+
+@lru_cache(maxsize=32)
+def _fixed_format_spec(digits: int) -> str:
+    return f".{digits}f"
+
+
+def _comparison(op: Callable[[Any, Any], Any]) -> Callable[[Any, Interpreter], None]:
+    """Build a ( a b -- result ) word body that applies a C-level operator function."""
+
+    def compare(self: Any, interp: Interpreter) -> None:
+        a, b = interp.stack_popn(2)
+        interp.stack_push(op(a, b))
+
+    compare.__name__ = op.__name__
+    return compare
+
 
 class MathModule(DecoratedModule):
     """Mathematical operations and utilities including arithmetic, aggregation, and conversions."""
@@ -50,94 +90,78 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
         "Add two numbers or sum array",
         "+",
     )
-    async def plus(self, interp: Interpreter) -> None:
+    def plus(self, interp: Interpreter) -> None:
         b = interp.stack_pop()
 
         # Case 1: Array on top of stack
-        if isinstance(b, list):
-            result = 0
-            for num in b:
-                if num is not None:
-                    result += num
-            interp.stack_push(result)
+        if type(b) is list or isinstance(b, list):
+            interp.stack_push(_sum_numbers(b))
             return
 
-        # Case 2: Two numbers
-        a = interp.stack_pop()
+        # Case 2: Two numbers; the sum overwrites a's stack slot
+        stack = interp.get_stack()
+        if len(stack) == 0:
+            interp.stack_pop()  # raises StackUnderflowError
+        a = interp.stack_peek()
         num_a = 0 if a is None else a
         num_b = 0 if b is None else b
-        interp.stack_push(num_a + num_b)
+        stack[-1] = num_a + num_b
 
-    @ForthicDirectWord(
+    # Aliases reuse the undecorated implementation rather than delegating through a wrapper
+    plus_ADD = ForthicDirectWord(
         "( a:number b:number -- sum:number ) OR ( numbers:number[] -- sum:number )", "Add two numbers or sum array", "ADD"
-    )
-    async def plus_ADD(self, interp: Interpreter) -> None:
-        return await self.plus(interp)
+    )(plus.__wrapped__)
 
     @WordDecorator("( a:number b:number -- difference:number )", "Subtract b from a", "-")
-    async def minus(self, a: float | int | None, b: float | int | None) -> float | int | None:
+    def minus(self, a: float | int | None, b: float | int | None) -> float | int | None:
         if a is None or b is None:
             return None
         return a - b
 
-    @WordDecorator("( a:number b:number -- difference:number )", "Subtract b from a", "SUBTRACT")
-    async def minus_SUBTRACT(self, a: float | int | None, b: float | int | None) -> float | int | None:
-        if a is None or b is None:
-            return None
-        return a - b
+    minus_SUBTRACT = WordDecorator(
+        "( a:number b:number -- difference:number )", "Subtract b from a", "SUBTRACT"
+    )(minus.__wrapped__)
 
     @ForthicDirectWord(
         "( a:number b:number -- product:number ) OR ( numbers:number[] -- product:number )",
         "Multiply two numbers or product of array",
         "*",
     )
-    async def times(self, interp: Interpreter) -> None:
+    def times(self, interp: Interpreter) -> None:
         b = interp.stack_pop()
 
         # Case 1: Array on top of stack
-        if isinstance(b, list):
-            result = 1
-            for num in b:
-                if num is None:
-                    interp.stack_push(None)
-                    return
-                result *= num
-            interp.stack_push(result)
+        if type(b) is list or isinstance(b, list):
+            interp.stack_push(None if None in b else _prod(b))
             return
 
-        # Case 2: Two numbers
-        a = interp.stack_pop()
-        if a is None or b is None:
-            interp.stack_push(None)
-            return
-        interp.stack_push(a * b)
+        # Case 2: Two numbers; the product overwrites a's stack slot
+        stack = interp.get_stack()
+        if len(stack) == 0:
+            interp.stack_pop()  # raises StackUnderflowError
+        a = interp.stack_peek()
+        stack[-1] = None if a is None or b is None else a * b
 
-    @ForthicDirectWord(
+    times_MULTIPLY = ForthicDirectWord(
         "( a:number b:number -- product:number ) OR ( numbers:number[] -- product:number )",
         "Multiply two numbers or product of array",
         "MULTIPLY",
-    )
-    async def times_MULTIPLY(self, interp: Interpreter) -> None:
-        return await self.times(interp)
+    )(times.__wrapped__)
 
     @WordDecorator("( a:number b:number -- quotient:number )", "Divide a by b", "/")
-    async def divide_by(self, a: float | int | None, b: float | int | None) -> float | None:
+    def divide_by(self, a: float | int | None, b: float | int | None) -> float | None:
         if a is None or b is None:
             return None
         if b == 0:
             return None
         return a / b
 
-    @WordDecorator("( a:number b:number -- quotient:number )", "Divide a by b", "DIVIDE")
-    async def divide_by_DIVIDE(self, a: float | int | None, b: float | int | None) -> float | None:
-        if a is None or b is None:
-            return None
-        if b == 0:
-            return None
-        return a / b
+    divide_by_DIVIDE = WordDecorator(
+        "( a:number b:number -- quotient:number )", "Divide a by b", "DIVIDE"
+    )(divide_by.__wrapped__)
 
     @WordDecorator("( m:number n:number -- remainder:number )", "Modulo operation (m % n)")
-    async def MOD(self, m: float | int | None, n: float | int | None) -> float | int | None:
+    def MOD(self, m: float | int | None, n: float | int | None) -> float | int | None:
         if m is None or n is None:
             return None
         return m % n
@@ -147,18 +171,18 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
     # ==================
 
     @WordDecorator("( items:any[] -- mean:any )", "Calculate mean of array (handles numbers, strings, objects)")
-    async def MEAN(self, items: Any) -> Any:
-        if not items or (isinstance(items, list) and len(items) == 0):
+    def MEAN(self, items: Any) -> Any:
+        if not items:
             return 0
 
-        if not isinstance(items, list):
+        if type(items) is not list and not isinstance(items, list):
             return items
 
         if len(items) == 1:
             return items[0]
 
-        # Filter out null/None values
-        filtered = [x for x in items if x is not None]
+        # Filter out null/None values (skipped when there are none, the common case)
+        filtered = items if None not in items else [x for x in items if x is not None]
 
         if len(filtered) == 0:
             return 0
@@ -168,49 +192,35 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
 
         # Case 1: Numbers
         if isinstance(first, (int, float)):
-            total = sum(filtered)
-            return total / len(filtered)
+            return fmean(filtered)
 
         # Case 2: Strings - return frequency distribution
         if isinstance(first, str):
-            counts: dict[str, int] = {}
-            for item in filtered:
-                counts[item] = counts.get(item, 0) + 1
-            result: dict[str, float] = {}
-            for key in counts:
-                result[key] = counts[key] / len(filtered)
-            return result
+            n = len(filtered)
+            return {key: count / n for key, count in Counter(filtered).items()}
 
         # Case 3: Objects - field-wise mean
         if isinstance(first, dict):
-            result_dict: dict[str, Any] = {}
-            all_keys: set[str] = set()
-
-            # Collect all keys
+            # Gather each field's non-null values in a single pass over the objects
+            values_by_key: dict[str, list[Any]] = {}
             for obj in filtered:
-                for key in obj.keys():
-                    all_keys.add(key)
-
-            # Compute mean for each key
-            for key in all_keys:
-                values = [obj.get(key) for obj in filtered if obj.get(key) is not None]
-
-                if len(values) == 0:
-                    continue
-
+                for key, value in obj.items():
+                    if value is not None:
+                        if key in values_by_key:
+                            values_by_key[key].append(value)
+                        else:
+                            values_by_key[key] = [value]
+
+            # Compute mean for each key, by the type of its first value
+            result_dict: dict[str, Any] = {}
+            for key, values in values_by_key.items():
                 first_val = values[0]
 
                 if isinstance(first_val, (int, float)):
-                    total = sum(values)
-                    result_dict[key] = total / len(values)
+                    result_dict[key] = fmean(values)
                 elif isinstance(first_val, str):
-                    counts_inner: dict[str, int] = {}
-                    for val in values:
-                        counts_inner[val] = counts_inner.get(val, 0) + 1
-                    freqs: dict[str, float] = {}
-                    for k in counts_inner:
-                        freqs[k] = counts_inner[k] / len(values)
-                    result_dict[key] = freqs
+                    n = len(values)
+                    result_dict[key] = {k: count / n for k, count in Counter(values).items()}
 
             return result_dict
 
@@ -219,56 +229,56 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
     @ForthicDirectWord(
         "( a:number b:number -- max:number ) OR ( items:number[] -- max:number )", "Maximum of two numbers or array", "MAX"
     )
-    async def MAX(self, interp: Interpreter) -> None:
+    def MAX(self, interp: Interpreter) -> None:
         b = interp.stack_pop()
 
         # Case 1: Array on top of stack
-        if isinstance(b, list):
+        if type(b) is list or isinstance(b, list):
             if len(b) == 0:
                 interp.stack_push(None)
                 return
             interp.stack_push(max(b))
             return
 
-        # Case 2: Two values
+        # Case 2: Two values (same tie-breaking as max(a, b))
         a = interp.stack_pop()
-        interp.stack_push(max(a, b))
+        interp.stack_push(b if b > a else a)
 
     @ForthicDirectWord(
         "( a:number b:number -- min:number ) OR ( items:number[] -- min:number )", "Minimum of two numbers or array", "MIN"
     )
-    async def MIN(self, interp: Interpreter) -> None:
+    def MIN(self, interp: Interpreter) -> None:
         b = interp.stack_pop()
 
         # Case 1: Array on top of stack
-        if isinstance(b, list):
+        if type(b) is list or isinstance(b, list):
             if len(b) == 0:
                 interp.stack_push(None)
                 return
             interp.stack_push(min(b))
             return
 
-        # Case 2: Two values
+        # Case 2: Two values (same tie-breaking as min(a, b))
         a = interp.stack_pop()
-        interp.stack_push(min(a, b))
+        interp.stack_push(b if b < a else a)
 
     @WordDecorator("( numbers:number[] -- sum:number )", "Sum of array (explicit)")
-    async def SUM(self, numbers: list | None) -> float | int:
-        if not numbers or not isinstance(numbers, list):
+    def SUM(self, numbers: list | None) -> float | int:
+        if not numbers or (type(numbers) is not list and not isinstance(numbers, list)):
             return 0
 
-        result = 0
-        for num in numbers:
-            if num is not None:
-                result += num
-        return result
+        return cast("float | int", _sum_numbers(numbers))
 
     # ==================
     # Type Conversion
     # ==================
 
     @WordDecorator("( a:any -- int:number )", "Convert to integer (returns length for arrays/objects, 0 for null)", ">INT")
-    async def to_INT(self, a: Any) -> int:
+    def to_INT(self, a: Any) -> int:
+        # Already an int (bools fall through to the float conversion below)
+        if type(a) is int:
+            return a
+
         if a is None:
             return 0
 
@@ -278,12 +288,18 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
             return len(a.keys())
 
         try:
-            return int(math.trunc(float(a)))
+            # int() truncates floats toward zero; NaN raises ValueError
+            if type(a) is float:
+                return int(a)
+            return int(_trunc(float(a)))
         except (ValueError, TypeError):
             return 0
 
     @WordDecorator("( a:any -- float:number )", "Convert to float", ">FLOAT")
-    async def to_FLOAT(self, a: Any) -> float:
+    def to_FLOAT(self, a: Any) -> float:
+        if type(a) is float:
+            return a
+
         if a is None:
             return 0.0
 
@@ -293,14 +309,14 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
             return 0.0
 
     @WordDecorator("( num:number digits:number -- result:string )", "Format number with fixed decimal places", ">FIXED")
-    async def to_FIXED(self, num: float | int | None, digits: int) -> str | None:
+    def to_FIXED(self, num: float | int | None, digits: int) -> str | None:
         if num is None:
             return None
 
-        return f"{num:.{digits}f}"
+        return format(num, _fixed_format_spec(digits))
 
     @WordDecorator("( num:number -- int:number )", "Round to nearest integer")
-    async def ROUND(self, num: float | int | None) -> int | None:
+    def ROUND(self, num: float | int | None) -> int | None:
         if num is None:
             return None
 
@@ -311,85 +327,81 @@ Mathematical operations and utilities including arithmetic, aggregation, and con
     # ==================
 
     @WordDecorator("( -- infinity:number )", "Push Infinity value")
-    async def INFINITY(self) -> float:
-        return float("inf")
+    def INFINITY(self) -> float:
+        return _inf
 
     @WordDecorator(
         "( low:number high:number -- random:number )", "Generate random number in range [low, high)", "UNIFORM-RANDOM"
     )
-    async def UNIFORM_RANDOM(self, low: float | int, high: float | int) -> float:
-        import random
-
-        return random.random() * (high - low) + low
+    def UNIFORM_RANDOM(self, low: float | int, high: float | int) -> float:
+        return _random() * (high - low) + low
 
     # ==================
     # Math Functions
     # ==================
 
     @WordDecorator("( n:number -- abs:number )", "Absolute value")
-    async def ABS(self, n: float | int | None) -> float | int | None:
+    def ABS(self, n: float | int | None) -> float | int | None:
         if n is None:
             return None
         return abs(n)
 
     @WordDecorator("( n:number -- sqrt:number )", "Square root")
-    async def SQRT(self, n: float | int | None) -> float | None:
+    def SQRT(self, n: float | int | None) -> float | None:
         if n is None:
             return None
-        return math.sqrt(n)
+        return _sqrt(n)
 
     @WordDecorator("( n:number -- floor:number )", "Round down to integer")
-    async def FLOOR(self, n: float | int | None) -> int | None:
+    def FLOOR(self, n: float | int | None) -> int | None:
         if n is None:
             return None
-        return math.floor(n)
+        return _floor(n)
 
     @WordDecorator("( n:number -- ceil:number )", "Round up to integer")
-    async def CEIL(self, n: float | int | None) -> int | None:
+    def CEIL(self, n: float | int | None) -> int | None:
         if n is None:
             return None
-        return math.ceil(n)
+        return _ceil(n)
 
     @ForthicDirectWord("( value:number min:number max:number -- clamped:number )", "Constrain value to range [min, max]", "CLAMP")
-    async def CLAMP(
+    def CLAMP(
             self, interp: Interpreter
     ) -> None:
-        max_val = interp.stack_pop()
-        min_val = interp.stack_pop()
-        value = interp.stack_pop()
+        value, min_val, max_val = interp.stack_popn(3)
         if value is None or min_val is None or max_val is None:
             interp.stack_push(None)
-        else:
-            interp.stack_push(max(min_val, min(max_val, value)))
+            return
+
+        # Same result as max(min_val, min(max_val, value)) without the builtin calls
+        clamped = value if value < max_val else max_val
+        interp.stack_push(clamped if clamped > min_val else min_val)
 
     # ==================
     # Comparison (from original implementation)
     # ==================
 
-    @WordDecorator("( a:any b:any -- result:bool )", "Less than", "<")
-    async def less_than(self, a: Any, b: Any) -> bool:
-        return a < b
-
-    @WordDecorator("( a:any b:any -- result:bool )", "Greater than", ">")
-    async def greater_than(self, a: Any, b: Any) -> bool:
-        return a > b
-
-    @WordDecorator("( a:any b:any -- result:bool )", "Less than or equal", "<=")
-    async def less_equal(self, a: Any, b: Any) -> bool:
-        return a <= b
-
-    @WordDecorator("( a:any b:any -- result:bool )", "Greater than or equal", ">=")
-    async def greater_equal(self, a: Any, b: Any) -> bool:
-        return a >= b
+    less_than = ForthicDirectWord("( a:any b:any -- result:bool )", "Less than", "<")(
+        _comparison(operator.lt)
+    )
+    greater_than = ForthicDirectWord("( a:any b:any -- result:bool )", "Greater than", ">")(
+        _comparison(operator.gt)
+    )
+    less_equal = ForthicDirectWord("( a:any b:any -- result:bool )", "Less than or equal", "<=")(
+        _comparison(operator.le)
+    )
+    greater_equal = ForthicDirectWord("( a:any b:any -- result:bool )", "Greater than or equal", ">=")(
+        _comparison(operator.ge)
+    )
 
     # ==================
     # Constants (from original implementation)
     # ==================
 
     @WordDecorator("( -- pi:float )", "Push mathematical constant pi")
-    async def PI(self) -> float:
-        return math.pi
+    def PI(self) -> float:
+        return _pi
 
     @WordDecorator("( -- e:float )", "Push mathematical constant e")
-    async def E(self) -> float:
-        return math.e
+    def E(self) -> float:
+        return _e
@@ -1,5 +1,6 @@
 """Tokenizer for Forthic language."""
 
+import sys
 from dataclasses import dataclass
 from enum import IntEnum
 
@@ -426,7 +427,8 @@ class Tokenizer:
                 break
             else:
                 self.token_string += char
-        return Token(TokenType.WORD, self.token_string, self._get_token_location())
+        # Word names are interned to match the (interned) names of dictionary words
+        return Token(TokenType.WORD, sys.intern(self.token_string), self._get_token_location())
 
     def _transition_from_GATHER_DOT_SYMBOL(self) -> Token:
         """Gather a dot symbol token."""
@@ -288,6 +288,36 @@ class TestInterpreterDuplication:
         assert len(interp.get_stack()) == 1
         assert len(dup.get_stack()) == 2
 
+    @pytest.mark.asyncio
+    async def test_dup_interpreter_preserves_prefixed_imports(self) -> None:
+        """Test that dup_interpreter keeps prefixed module words available."""
+        interp = StandardInterpreter()
+        module = Module("extra")
+        module.add_exportable_word(PushValueWord("ANSWER", 42))
+        interp.register_module(module)
+        interp.use_modules([["extra", "x"]])
+
+        dup = dup_interpreter(interp)
+        await dup.run("x.ANSWER")
+
+        assert dup.stack_pop() == 42
+        assert dup.get_app_module().module_prefixes["extra"] == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_dup_interpreter_isolates_module_state(self) -> None:
+        """Test that module variables set in a duplicate don't leak into the original."""
+        interp = StandardInterpreter()
+        await interp.run("{mymod ['x'] VARIABLES 1 x ! }")
+
+        dup = dup_interpreter(interp)
+        await dup.run("{mymod 99 x ! }")
+        await interp.run("{mymod x @ }")
+        await dup.run("{mymod x @ }")
+
+        assert interp.stack_pop() == 1
+        assert dup.stack_pop() == 99
+        assert dup.get_app_module().find_module("mymod") is not interp.get_app_module().find_module("mymod")
+
     @pytest.mark.asyncio
     async def test_dup_interpreter_preserves_timezone(self) -> None:
         """Test that dup_interpreter preserves timezone."""
@@ -133,6 +133,27 @@ class TestWordDecorator:
         result = interp.stack_pop()
         assert result == [2, 4, 6]
 
+    @pytest.mark.asyncio
+    async def test_sync_word(self) -> None:
+        """Test @ForthicWord on a plain (non-async) method."""
+
+        class TestModule(DecoratedModule):
+            def __init__(self):
+                super().__init__("test")
+
+            @ForthicWord("( a:number b:number -- diff:number )", "Subtract")
+            def SUB(self, a: int, b: int) -> int:
+                return a - b
+
+        interp = Interpreter()
+        module = TestModule()
+        interp.import_module(module._module)
+
+        await interp.run(": DIFF   10 4 SUB ;  DIFF 1 SUB")
+        result = interp.stack_pop()
+        assert result == 5
+        assert interp.get_app_module().find_word("SUB").is_async is False
+
 
 class TestDirectWordDecorator:
     """Test @ForthicDirectWord decorator functionality."""
@@ -184,6 +205,27 @@ class TestDirectWordDecorator:
         assert len(stack) == 3
         assert all(stack[i] == 5 for i in range(3))
 
+    @pytest.mark.asyncio
+    async def test_sync_direct_word(self) -> None:
+        """Test @ForthicDirectWord on a plain (non-async) method."""
+
+        class TestModule(DecoratedModule):
+            def __init__(self):
+                super().__init__("test")
+
+            @ForthicDirectWord("( a:any -- a:any a:any )", "Duplicate top of stack", "2X")
+            def TWO_X(self, interp: Interpreter) -> None:
+                a = interp.stack_pop()
+                interp.stack_push(a)
+                interp.stack_push(a)
+
+        interp = Interpreter()
+        module = TestModule()
+        interp.import_module(module._module)
+
+        await interp.run("7 2X")
+        assert interp.get_stack().get_items() == [7, 7]
+
 
 class TestDecoratedModule:
     """Test DecoratedModule functionality."""
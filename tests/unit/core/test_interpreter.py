@@ -2,7 +2,14 @@
 
 import pytest
 
-from forthic import Interpreter, Module, PushValueWord, StackUnderflowError, UnknownWordError
+from forthic import (
+    Interpreter,
+    Module,
+    PushValueWord,
+    StackUnderflowError,
+    TooManyAttemptsError,
+    UnknownWordError,
+)
 
 
 class TestBasicExecution:
@@ -63,6 +70,21 @@ class TestBasicExecution:
         assert len(stack) == 1
         assert stack[0] == [[1, 2], [3, 4]]
 
+    @pytest.mark.asyncio
+    async def test_array_strings_are_unwrapped(self) -> None:
+        interp = Interpreter()
+        await interp.run('"top" ["a" ["b"]]')
+        raw = interp.get_stack().get_raw_items()
+        assert type(raw[1][0]) is str
+        assert type(raw[1][1][0]) is str
+
+    @pytest.mark.asyncio
+    async def test_unmatched_end_array(self) -> None:
+        interp = Interpreter()
+        with pytest.raises(StackUnderflowError):
+            await interp.run("1 2 ]")
+        assert len(interp.get_stack()) == 0
+
 
 class TestDefinitions:
     """Test word definitions."""
@@ -109,6 +131,30 @@ class TestDefinitions:
         assert stack[0] == 5
         assert stack[1] == 5
 
+    @pytest.mark.asyncio
+    async def test_definition_mixing_literals_and_words(self) -> None:
+        interp = Interpreter()
+
+        await interp.run(": BASE 5 ;")
+        await interp.run(': MIXED 1 2 "three" BASE 4 [5] BASE ;')
+
+        await interp.run("MIXED MIXED")
+        stack = interp.get_stack().get_items()
+        assert stack == [1, 2, "three", 5, 4, [5], 5] * 2
+
+    @pytest.mark.asyncio
+    async def test_redefinition_shadows_earlier_word(self) -> None:
+        interp = Interpreter()
+
+        await interp.run(": VALUE 1 ;")
+        await interp.run(": OLD VALUE ;")
+        await interp.run(": VALUE 2 ;")
+
+        await interp.run("VALUE OLD")
+        stack = interp.get_stack()
+        assert stack[0] == 2
+        assert stack[1] == 1  # OLD compiled against the first definition
+
 
 class TestModules:
     """Test module system."""
@@ -161,15 +207,27 @@ class TestStackOperations:
             interp.stack_pop()
 
         module = Module("test")
-        word = PushValueWord("POP", None)
-        word.execute = pop_word  # type: ignore
-        module.add_exportable_word(word)
+        module.add_module_word("POP", pop_word)
         interp.import_module(module)
 
         # Try to pop from empty stack
         with pytest.raises(StackUnderflowError):
             await interp.run("POP")
 
+    @pytest.mark.asyncio
+    async def test_stack_popn(self) -> None:
+        interp = Interpreter()
+        await interp.run('1 "two" 3 4')
+
+        assert interp.stack_popn(3) == ["two", 3, 4]
+        assert interp.get_string_location() is not None
+        assert interp.stack_popn(0) == []
+        assert interp.get_stack().get_items() == [1]
+
+        with pytest.raises(StackUnderflowError):
+            interp.stack_popn(2)
+        assert interp.get_stack().get_items() == [1]
+
     @pytest.mark.asyncio
     async def test_unknown_word(self) -> None:
         interp = Interpreter()
@@ -180,6 +238,35 @@ class TestStackOperations:
         assert "UNDEFINED_WORD" in str(exc_info.value)
 
 
+class TestErrorRecovery:
+    """Test interpreter-level error handler recovery."""
+
+    @pytest.mark.asyncio
+    async def test_handler_resumes_execution(self) -> None:
+        errors: list[Exception] = []
+
+        async def handler(e: Exception, interp: Interpreter) -> None:
+            errors.append(e)
+
+        interp = Interpreter()
+        interp.set_error_handler(handler)
+        await interp.run("1 BOGUS 2")
+        assert len(errors) == 1
+        assert isinstance(errors[0], UnknownWordError)
+        assert interp.get_stack().get_items() == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_too_many_attempts(self) -> None:
+        async def handler(e: Exception, interp: Interpreter) -> None:
+            pass
+
+        interp = Interpreter()
+        interp.set_max_attempts(3)
+        interp.set_error_handler(handler)
+        with pytest.raises(TooManyAttemptsError):
+            await interp.run("BOGUS1 BOGUS2 BOGUS3 BOGUS4")
+
+
 class TestVariables:
     """Test variable system."""
 
@@ -203,6 +290,16 @@ class TestVariables:
         assert isinstance(var, Variable)
         assert var.get_value() == 42
 
+    def test_variable_lookup_reuses_word(self) -> None:
+        interp = Interpreter()
+        module = interp.get_app_module()
+        module.add_variable("MY_VAR", 42)
+
+        word = module.find_word("MY_VAR")
+        assert word is not None
+        assert module.find_word("MY_VAR") is word
+        assert module.find_variable("MISSING") is None
+
 
 class TestMemoWords:
     """Test memoized words."""
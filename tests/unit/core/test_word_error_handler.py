@@ -314,3 +314,53 @@ async def test_remove_nonexistent_handler_does_not_error():
     # Should not raise
     word.remove_error_handler(handler)
     assert len(word.get_error_handlers()) == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_uses_error_handlers():
+    """Plain (non-async) handlers still consult error handlers."""
+    interp = Interpreter()
+
+    def failing_handler(interp):
+        raise ValueError("Test error")
+
+    word = ModuleWord("TEST", failing_handler)
+    with pytest.raises(ValueError):
+        await word.execute(interp)
+
+    handled: list[Exception] = []
+
+    async def error_handler(error, word, interp):
+        handled.append(error)
+
+    word.add_error_handler(error_handler)
+
+    # With error handlers registered, the sync fast path defers to execute()
+    assert word.execute_sync(interp) is False
+    await word.execute(interp)
+    assert len(handled) == 1
+
+
+@pytest.mark.asyncio
+async def test_handlers_returning_awaitables_are_awaited():
+    """Handlers that return a coroutine run it, whatever kind of callable they are."""
+    interp = Interpreter()
+
+    async def push_hi(interp):
+        interp.stack_push("hi")
+
+    class AsyncCallable:
+        async def __call__(self, interp):
+            interp.stack_push("there")
+
+    words = [
+        ModuleWord("LAMBDA", lambda interp: push_hi(interp)),
+        ModuleWord("CALLABLE", AsyncCallable()),
+        ModuleWord("PLAIN", lambda interp: interp.stack_push("!")),
+    ]
+    for word in words:
+        # Only decorator-generated handlers are known to be sync
+        assert word.execute_sync(interp) is False
+        await word.execute(interp)
+
+    assert interp.get_stack().get_items() == ["hi", "there", "!"]
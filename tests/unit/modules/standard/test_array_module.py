@@ -31,6 +31,15 @@ class TestSimpleArrayOperations:
         await interp.run("[1 2 3] REVERSE")
         assert interp.stack_pop() == [3, 2, 1]
 
+    @pytest.mark.asyncio
+    async def test_rotate(self, interp):
+        """Test ROTATE moves the last element to the front without changing the input."""
+        items = [1, 2, 3]
+        interp.stack_push(items)
+        await interp.run("ROTATE  [] ROTATE")
+        assert interp.get_stack().get_items() == [[3, 1, 2], []]
+        assert items == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_unique(self, interp):
         """Test UNIQUE."""
@@ -70,6 +79,13 @@ class TestAccessOperations:
         await interp.run("[0 1 2 3 4 5 6] LAST")
         assert interp.stack_pop() == 6
 
+    @pytest.mark.asyncio
+    async def test_nth_and_last_of_record(self, interp):
+        """Test NTH and LAST index records by sorted key."""
+        interp.stack_push({"c": 3, "a": 1, "b": 2})
+        await interp.run("DUP 0 NTH  SWAP DUP 2 NTH  SWAP DUP 3 NTH  SWAP LAST")
+        assert interp.get_stack().get_items() == [1, 3, None, 3]
+
     @pytest.mark.asyncio
     async def test_slice(self, interp):
         """Test SLICE."""
@@ -82,6 +98,18 @@ class TestAccessOperations:
         await interp.run("['a' 'b' 'c' 'd' 'e' 'f' 'g'] 5 3 SLICE")
         assert interp.stack_pop() == ["f", "e", "d"]
 
+        await interp.run("['a' 'b' 'c'] 2 0 SLICE  ['a' 'b' 'c'] -1 4 SLICE  ['a' 'b' 'c'] 1 -5 SLICE")
+        assert interp.get_stack().get_items() == [
+            ["c", "b", "a"],
+            ["c", None, None],
+            ["b", "a", None, None],
+        ]
+        interp.get_stack().clear()
+
+        interp.stack_push({"c": 3, "a": 1, "b": 2})
+        await interp.run("2 0 SLICE")
+        assert list(interp.stack_pop().items()) == [("c", 3), ("b", 2), ("a", 1)]
+
     @pytest.mark.asyncio
     async def test_take(self, interp):
         """Test TAKE."""
@@ -119,6 +147,23 @@ class TestSetOperations:
         result = interp.stack_pop()
         assert sorted(result) == ["a", "c"]
 
+    @pytest.mark.asyncio
+    async def test_difference_and_intersection_of_records(self, interp):
+        """Test DIFFERENCE and INTERSECTION still work on unhashable items."""
+        interp.stack_push([{"a": 1}, {"a": 2}, [3]])
+        interp.stack_push([{"a": 2}, [3]])
+        await interp.run("DIFFERENCE")
+        assert interp.stack_pop() == [{"a": 1}]
+
+        interp.stack_push([{"a": 1}, {"a": 2}, [3]])
+        interp.stack_push([{"a": 2}, [3]])
+        await interp.run("INTERSECTION")
+        assert interp.stack_pop() == [{"a": 2}, [3]]
+
+        # Unhashable items on the left only, hashable on the right
+        await interp.run("[[['a' 1]] REC 2] [2] DIFFERENCE  [[['a' 1]] REC 2] [2] INTERSECTION")
+        assert interp.get_stack().get_items() == [[{"a": 1}], [2]]
+
     @pytest.mark.asyncio
     async def test_union(self, interp):
         """Test UNION."""
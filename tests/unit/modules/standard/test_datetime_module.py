@@ -182,6 +182,15 @@ async def test_to_DATETIME_parses_ISO_datetime_string(interp):
     assert result.minute == 30
 
 
+@pytest.mark.asyncio
+async def test_to_DATETIME_rejects_non_ISO_strings(interp):
+    """>DATETIME returns NULL for strings that are not ISO datetimes."""
+    await interp.run("'N/A' >DATETIME  '' >DATETIME  '2024-13-45' >DATETIME  '20240115' >DATETIME")
+    compact = interp.stack_pop()
+    assert (compact.year, compact.month, compact.day) == (2024, 1, 15)
+    assert interp.get_stack().get_items() == [None, None, None]
+
+
 @pytest.mark.asyncio
 async def test_to_DATETIME_converts_Unix_timestamp(interp):
     """>DATETIME converts Unix timestamp."""
@@ -328,6 +337,20 @@ async def test_ADD_DAYS_with_literal_date(interp):
     assert result.day == 2
 
 
+@pytest.mark.asyncio
+async def test_ADD_DAYS_with_array_of_dates(interp):
+    """ADD-DAYS adds days to each date in an array."""
+    await interp.run("[2020-10-21 2024-02-28] 2 ADD-DAYS")
+    assert interp.stack_pop() == [date(2020, 10, 23), date(2024, 3, 1)]
+
+
+@pytest.mark.asyncio
+async def test_ADD_DAYS_with_array_containing_null(interp):
+    """ADD-DAYS maps non-date array items to null."""
+    await interp.run("[2020-10-21 NULL] 1 ADD-DAYS")
+    assert interp.stack_pop() == [date(2020, 10, 22), None]
+
+
 @pytest.mark.asyncio
 async def test_SUBTRACT_DATES_calculates_positive_difference(interp):
     """SUBTRACT-DATES calculates positive difference."""
@@ -350,6 +373,13 @@ async def test_SUBTRACT_DATES_with_literal_dates(interp):
     assert interp.stack_pop() == -12
 
 
+@pytest.mark.asyncio
+async def test_SUBTRACT_DATES_with_arrays(interp):
+    """SUBTRACT-DATES subtracts arrays of dates element-wise."""
+    await interp.run("[2020-11-02 2024-03-01] [2020-10-21 2024-02-28] SUBTRACT-DATES")
+    assert interp.stack_pop() == [12, 2]
+
+
 @pytest.mark.asyncio
 async def test_SUBTRACT_DATES_with_same_date(interp):
     """SUBTRACT-DATES with same date."""
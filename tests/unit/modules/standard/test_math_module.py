@@ -4,7 +4,8 @@ import math
 
 import pytest
 
-from forthic import StandardInterpreter
+from forthic import Interpreter, StandardInterpreter
+from forthic.modules import MathModule
 
 
 @pytest.fixture
@@ -35,6 +36,12 @@ class TestArithmetic:
         assert stack[4] == 2
         assert stack[5] == 3
 
+    @pytest.mark.asyncio
+    async def test_named_aliases(self, interp):
+        """Test ADD, SUBTRACT, MULTIPLY and DIVIDE match their symbol forms."""
+        await interp.run("2 4 ADD  [1 2 3] ADD  2 4 SUBTRACT  2 4 MULTIPLY  [2 3] MULTIPLY  2 4 DIVIDE")
+        assert interp.get_stack().get_items() == [6, 6, -2, 8, 6, 0.5]
+
     @pytest.mark.asyncio
     async def test_divide(self, interp):
         """Test division."""
@@ -65,6 +72,14 @@ class TestComparison:
         await interp.run("2 4 >")
         assert interp.stack_pop() is False
 
+    @pytest.mark.asyncio
+    async def test_math_module_comparisons(self):
+        """Test the math module's own comparison words (shadowed by boolean's in StandardInterpreter)."""
+        interp = Interpreter()
+        interp.import_module(MathModule())
+        await interp.run("2 4 <  2 4 >  4 4 <=  2 4 >=")
+        assert interp.get_stack().get_items() == [True, False, True, False]
+
 
 class TestMaxMin:
     """Test MAX and MIN operations."""
@@ -235,6 +250,14 @@ class TestConverters:
         await interp.run("4.6 >INT")
         assert interp.stack_pop() == 4
 
+        await interp.run("-4.6 >INT  TRUE >INT  12345678901234567891 >INT")
+        assert interp.get_stack().get_items() == [-4, 1, 12345678901234567891]
+        interp.get_stack().clear()
+
+        interp.stack_push(float("nan"))
+        await interp.run(">INT")
+        assert interp.stack_pop() == 0
+
     @pytest.mark.asyncio
     async def test_to_float(self, interp):
         """Test >FLOAT converter."""
@@ -289,3 +312,14 @@ class TestAdvancedMath:
 
         await interp.run("[1 2 NULL 3 4] SUM")
         assert interp.stack_pop() == 10
+
+    @pytest.mark.asyncio
+    async def test_array_plus_and_times(self, interp):
+        """Test + and * over arrays, with and without nulls."""
+        await interp.run("[1 2 3 4] +  [1 NULL 3] +  [2 3 4] *  [2 NULL 4] *  [] *")
+        assert interp.get_stack().get_items() == [10, 4, 24, None, 1]
+
+    def test_words_are_sync(self, interp):
+        """Math words never await, so they run without a coroutine."""
+        for name in ["+", "ADD", "-", "*", "/", "MEAN", "CLAMP", "PI"]:
+            assert interp.find_word(name).is_async is False
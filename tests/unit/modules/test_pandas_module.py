@@ -1,8 +1,12 @@
 """Tests for Pandas Module."""
 
+import asyncio
+import warnings
+
 import pytest
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
     pytest.skip("pandas not installed", allow_module_level=True)
@@ -62,6 +66,58 @@ class TestConversionOperations:
         assert df.iloc[0]["name"] == "Alice"
         assert df.iloc[1]["age"] == 25
 
+    @pytest.mark.asyncio
+    async def test_to_df_matches_pandas_for_mixed_schemas(self, interp):
+        """Test >DF gives pd.DataFrame(records) results for same and differing keys."""
+        same_keys = [
+            {"a": 1, "b": "x"},
+            {"b": None, "a": 2},
+            {"a": 3, "b": "z"},
+        ]
+        differing_keys = [
+            {"a": 1, "b": 2.5},
+            {"a": 2, "c": "y"},
+        ]
+        for records in (same_keys, differing_keys):
+            interp.stack_push(records)
+            await interp.run("pd.>DF")
+
+            df = interp.stack_pop()
+            pd.testing.assert_frame_equal(df, pd.DataFrame(records))
+
+    @pytest.mark.asyncio
+    async def test_to_df_with_columns_and_dtypes(self, interp, sample_records):
+        """Test >DF with .columns selects/orders columns and .dtypes casts them."""
+        interp.stack_push(sample_records)
+        await interp.run("""
+            [.columns ['age' 'name' 'zip'] .dtypes [['age' 'float32']] REC] ~> pd.>DF
+        """)
+
+        df = interp.stack_pop()
+        assert list(df.columns) == ["age", "name", "zip"]
+        assert df["age"].dtype == "float32"
+        assert df["name"].tolist() == ["Alice", "Bob", "Charlie", "David"]
+        assert df["zip"].isna().all()
+
+    @pytest.mark.asyncio
+    async def test_to_df_empty_list_with_columns(self, interp):
+        """Test >DF with .columns keeps the columns for an empty list."""
+        await interp.run("[] [.columns ['a' 'b']] ~> pd.>DF")
+
+        df = interp.stack_pop()
+        assert df.empty
+        assert list(df.columns) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_to_df_empty_list_with_dtypes(self, interp):
+        """Test >DF with only .dtypes builds typed empty columns for an empty list."""
+        await interp.run("[] [.dtypes [['a' 'int64']] REC] ~> pd.>DF")
+
+        df = interp.stack_pop()
+        assert df.empty
+        assert list(df.columns) == ["a"]
+        assert df["a"].dtype == "int64"
+
     @pytest.mark.asyncio
     async def test_to_df_from_empty_list(self, interp):
         """Test >DF with empty list returns empty DataFrame."""
@@ -139,6 +195,54 @@ class TestConversionOperations:
         values = interp.stack_pop()
         assert values == [10, 20, 30, 40]
 
+    @pytest.mark.asyncio
+    async def test_to_df_arrow_strings(self, interp):
+        """Test >DF with .strings 'arrow' stores string columns as string[pyarrow]."""
+        pytest.importorskip("pyarrow")
+        await interp.run("""
+            [
+                [['name' 'Alice'] ['age' 30]] REC
+                [['name' 'Bob'] ['age' 25]] REC
+            ] [.strings 'arrow'] ~> pd.>DF
+        """)
+
+        df = interp.stack_pop()
+        assert df["name"].dtype == "string[pyarrow]"
+        assert df["age"].dtype == "int64"
+
+    @pytest.mark.asyncio
+    async def test_to_df_arrow_strings_requires_pyarrow(self, interp):
+        """Test >DF with .strings 'arrow' explains the missing dependency."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("pyarrow is installed")
+
+        with pytest.raises(Exception, match="requires pyarrow"):
+            await interp.run("[[['name' 'Alice']] REC] [.strings 'arrow'] ~> pd.>DF")
+
+    @pytest.mark.asyncio
+    async def test_series_to_numpy(self, interp):
+        """Test SERIES> with .as 'numpy' returns the Series' ndarray."""
+        series = pd.Series([10, 20, 30, 40])
+        interp.stack_push(series)
+        await interp.run("[.as 'numpy'] ~> pd.SERIES>")
+
+        values = interp.stack_pop()
+        assert isinstance(values, np.ndarray)
+        assert values.tolist() == [10, 20, 30, 40]
+        assert np.shares_memory(values, series.to_numpy())
+
+    def test_words_are_sync(self, interp):
+        """Words that never run Forthic code execute without a coroutine."""
+        # Prefixed imports wrap the module's word in an ExecuteWord
+        for name in ["pd.>DF", "pd.DF>", "pd.SERIES>", "pd.DF.SHAPE", "pd.DF@"]:
+            assert interp.find_word(name).target_word.is_async is False
+        for name in ["pd.DF.FILTER", "pd.DF.APPLY-COL"]:
+            assert interp.find_word(name).target_word.is_async is True
+
     @pytest.mark.asyncio
     async def test_series_to_list_empty(self, interp):
         """Test SERIES> with empty Series returns empty list."""
@@ -213,6 +317,16 @@ class TestInspectionOperations:
         assert result.iloc[0]["name"] == "Charlie"
         assert result.iloc[1]["name"] == "David"
 
+    @pytest.mark.asyncio
+    async def test_df_tail_zero(self, interp, sample_df):
+        """Test DF.TAIL with n 0 returns no rows, like DataFrame.tail(0)."""
+        interp.stack_push(sample_df)
+        await interp.run("[.n 0] ~> pd.DF.TAIL")
+
+        result = interp.stack_pop()
+        assert result.empty
+        assert list(result.columns) == ["name", "age", "city"]
+
     @pytest.mark.asyncio
     async def test_df_shape(self, interp, sample_df):
         """Test DF.SHAPE returns [rows, cols]."""
@@ -390,6 +504,8 @@ class TestColumnOperations:
         result = interp.stack_pop()
         assert isinstance(result, pd.DataFrame)
         assert result["age"].tolist() == [31, 26, 36, 29]
+        # The input DataFrame is left unchanged
+        assert sample_df["age"].tolist() == [30, 25, 35, 28]
 
     @pytest.mark.asyncio
     async def test_df_drop_cols(self, interp, sample_df):
@@ -432,6 +548,9 @@ class TestColumnOperations:
         result = interp.stack_pop()
         assert isinstance(result, pd.DataFrame)
         assert list(result.columns) == ["full_name", "years", "city"]
+        assert result["years"].tolist() == [30, 25, 35, 28]
+        # The input DataFrame keeps its column names
+        assert list(sample_df.columns) == ["name", "age", "city"]
 
     @pytest.mark.asyncio
     async def test_df_rename_cols_empty_mapping(self, interp, sample_df):
@@ -488,6 +607,51 @@ class TestColumnOperations:
         # (age + 10) / 2
         assert series.tolist() == [20, 17.5, 22.5, 19]
 
+    @pytest.mark.asyncio
+    async def test_df_apply_col_runs_per_value(self, interp):
+        """Test DF.APPLY-COL gives each value to the code by default."""
+        interp.stack_push(pd.DataFrame({'s': ['x', None, 'y']}))
+        # On a whole Series, NULL == would compare the Series object itself
+        await interp.run("'s' 'NULL ==' pd.DF.APPLY-COL")
+
+        assert interp.stack_pop().tolist() == [False, True, False]
+
+    @pytest.mark.asyncio
+    async def test_df_apply_col_vectorized(self, interp, sample_df):
+        """Test DF.APPLY-COL with .vectorized runs the code once on the Series."""
+        interp.stack_push(sample_df)
+        await interp.run("'age' '2 *' [.vectorized TRUE] ~> pd.DF.APPLY-COL")
+
+        series = interp.stack_pop()
+        assert series.tolist() == [60, 50, 70, 56]
+        assert series.name == "age"
+
+        interp.stack_push(sample_df)
+        with pytest.raises(Exception, match="must return a Series or array of 4 values"):
+            await interp.run("'age' 'pd.SERIES> LENGTH' [.vectorized TRUE] ~> pd.DF.APPLY-COL")
+
+    @pytest.mark.asyncio
+    async def test_df_apply_col_keeps_stack(self, interp, sample_df):
+        """Test DF.APPLY-COL leaves values below its arguments untouched."""
+        interp.stack_push("sentinel")
+        interp.stack_push(sample_df)
+        await interp.run("'age' '>STR' pd.DF.APPLY-COL")
+
+        series = interp.stack_pop()
+        assert series.tolist() == ["30", "25", "35", "28"]
+        assert series.name == "age"
+        assert interp.get_stack().get_items() == ["sentinel"]
+
+    @pytest.mark.asyncio
+    async def test_df_apply_col_per_value_infers_dtype(self, interp, sample_df):
+        """Test DF.APPLY-COL per-value results get a numeric dtype when possible."""
+        interp.stack_push(sample_df)
+        await interp.run("'age' '>STR >INT' pd.DF.APPLY-COL")
+
+        series = interp.stack_pop()
+        assert series.dtype == "int64"
+        assert series.tolist() == [30, 25, 35, 28]
+
     @pytest.mark.asyncio
     async def test_df_apply_col_missing_column(self, interp, sample_df):
         """Test DF.APPLY-COL raises error for missing column."""
@@ -496,6 +660,26 @@ class TestColumnOperations:
         with pytest.raises(KeyError, match="not found"):
             await interp.run("'invalid' '2 *' pd.DF.APPLY-COL")
 
+    @pytest.mark.asyncio
+    async def test_df_apply_col_batch(self, interp, sample_df):
+        """Test DF.APPLY-COL-BATCH runs Forthic once per block of values."""
+        interp.stack_push(sample_df)
+        # Blocks of 3 and 1 values; each is an ndarray
+        await interp.run("'age' 3 '2 *' pd.DF.APPLY-COL-BATCH")
+
+        series = interp.stack_pop()
+        assert series.tolist() == [60, 50, 70, 56]
+        assert series.name == "age"
+        assert series.index.equals(sample_df.index)
+
+    @pytest.mark.asyncio
+    async def test_df_apply_col_batch_wrong_length(self, interp, sample_df):
+        """Test DF.APPLY-COL-BATCH rejects code that changes the block length."""
+        interp.stack_push(sample_df)
+
+        with pytest.raises(Exception, match="must return 3 values"):
+            await interp.run("'age' 3 'POP [1]' pd.DF.APPLY-COL-BATCH")
+
     @pytest.mark.asyncio
     async def test_df_astype(self, interp):
         """Test DF.ASTYPE converts column dtype."""
@@ -506,6 +690,7 @@ class TestColumnOperations:
         result = interp.stack_pop()
         assert isinstance(result, pd.DataFrame)
         assert result["a"].dtype == float
+        assert df["a"].dtype == "int64"
 
     @pytest.mark.asyncio
     async def test_df_astype_to_string(self, interp, sample_df):
@@ -612,6 +797,94 @@ class TestRowOperations:
         assert result.iloc[0]["name"] == "Alice"
         assert result.iloc[1]["name"] == "Charlie"
 
+    @pytest.mark.asyncio
+    async def test_df_filter_row_values_keep_column_types(self, interp):
+        """Test DF.FILTER rows carry each column's own value type."""
+        df = pd.DataFrame({"n": [1, 2, 3], "x": [0.5, 1.5, 2.5]})
+        interp.stack_push(df)
+        # iterrows() would have upcast n to float in this mixed frame ("2.0")
+        await interp.run("'\"n\" REC@ >STR \"2\" ==' pd.DF.FILTER")
+
+        result = interp.stack_pop()
+        assert result["n"].tolist() == [2]
+        assert result.index.tolist() == [1]
+
+    @pytest.mark.asyncio
+    async def test_df_filter_compound_predicate_with_missing_values(self, interp):
+        """Test DF.FILTER with AND/OR/NOT matches per-row semantics on NaN."""
+        df = pd.DataFrame({"age": [20, 40, None, 35], "city": ["NYC", "LA", "NYC", "SF"]})
+        interp.stack_push(df)
+        await interp.run(
+            "'DUP \"age\" REC@ 30 > SWAP \"city\" REC@ \"NYC\" == OR NOT' pd.DF.FILTER"
+        )
+
+        result = interp.stack_pop()
+        assert result.index.tolist() == []
+
+        interp.stack_push(df)
+        await interp.run(
+            "'DUP \"city\" REC@ \"NYC\" != SWAP \"age\" REC@ 30 > AND' pd.DF.FILTER"
+        )
+
+        result = interp.stack_pop()
+        assert result.index.tolist() == [1, 3]
+
+    def test_predicate_to_query_translation(self, interp):
+        """Test only simple column comparisons are translated to query()."""
+        from forthic.modules.pandas_module import _forthic_predicate_to_query
+
+        df = pd.DataFrame(
+            {"age": [30.0, None], "home city": ["NYC", "LA"], "note": ["a", None]}
+        )
+        assert _forthic_predicate_to_query(interp, '"age" REC@ 30 >=', df) == "(`age` >= 30)"
+        assert (
+            _forthic_predicate_to_query(interp, '"home city" REC@ "NYC" ==', df)
+            == "(`home city` == 'NYC')"
+        )
+        assert _forthic_predicate_to_query(interp, '"age" REC@ 2 *', df) is None
+        assert _forthic_predicate_to_query(interp, '"other" REC@ 1 ==', df) is None
+        assert (
+            _forthic_predicate_to_query(interp, 'DUP "age" REC@ 30 > SWAP "age" REC@ 60 < AND', df)
+            == "((`age` > 30) & (`age` < 60))"
+        )
+        assert _forthic_predicate_to_query(interp, "1 2 <", df) is None
+        # None values are not pushed by REC@, so they must run per row
+        assert _forthic_predicate_to_query(interp, '"note" REC@ "a" ==', df) is None
+        # REC@ consumes the record, so a second lookup needs DUP
+        assert (
+            _forthic_predicate_to_query(interp, '"age" REC@ 30 > "age" REC@ 60 < AND', df)
+            is None
+        )
+        # Numbers are only compared with numbers, strings with string constants
+        assert _forthic_predicate_to_query(interp, '"age" REC@ "30" ==', df) is None
+        assert _forthic_predicate_to_query(interp, 'DUP "home city" REC@ SWAP "home city" REC@ ==', df) is None
+
+        other = pd.DataFrame(
+            {"d": pd.to_datetime(["2024-01-01", "2024-01-03"]), "c": pd.Categorical(["a", "b"])}
+        )
+        assert _forthic_predicate_to_query(interp, '"d" REC@ "2024-01-02" >', other) is None
+        assert _forthic_predicate_to_query(interp, '"c" REC@ "a" ==', other) is None
+
+    @pytest.mark.asyncio
+    async def test_df_filter_datetime_column_runs_per_row(self, interp):
+        """Test DF.FILTER on a datetime column behaves like the per-row predicate."""
+        df = pd.DataFrame({"d": pd.to_datetime(["2024-01-01", "2024-01-03"])})
+        interp.stack_push(df)
+
+        with pytest.raises(Exception, match="not supported"):
+            await interp.run("'\"d\" REC@ \"2024-01-02\" >' pd.DF.FILTER")
+
+    @pytest.mark.asyncio
+    async def test_df_filter_respects_redefined_words(self, interp):
+        """Test DF.FILTER predicates use the words in scope, not the standard ones."""
+        df = pd.DataFrame({"age": [20, 40]})
+        await interp.run(": > < ;")
+        interp.stack_push(df)
+        await interp.run("'\"age\" REC@ 30 >' pd.DF.FILTER")
+
+        result = interp.stack_pop()
+        assert result["age"].tolist() == [20]
+
     @pytest.mark.asyncio
     async def test_df_filter_no_matches(self, interp, sample_df):
         """Test DF.FILTER returns empty DataFrame when no rows match."""
@@ -655,6 +928,55 @@ class TestRowOperations:
         result = interp.stack_pop()
         assert len(result) == 4
 
+    @pytest.mark.asyncio
+    async def test_df_drop_rows_duplicate_and_missing_labels(self, interp):
+        """Test DF.DROP-ROWS drops every row with a label and ignores unknown labels."""
+        df = pd.DataFrame({"a": [1, 2, 3, 4]}, index=["x", "y", "y", "z"])
+        interp.stack_push(df)
+        await interp.run("['y' 'missing'] pd.DF.DROP-ROWS")
+
+        result = interp.stack_pop()
+        assert result.index.tolist() == ["x", "z"]
+        assert result["a"].tolist() == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_df_drop_rows_datetime_index_with_strings(self, interp):
+        """Test DF.DROP-ROWS matches date strings against a DatetimeIndex without warnings."""
+        df = pd.DataFrame({"a": [1, 2, 3]}, index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]))
+        interp.stack_push(df)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            await interp.run("['2024-01-01' '2024-01-03'] pd.DF.DROP-ROWS")
+
+        result = interp.stack_pop()
+        assert result["a"].tolist() == [2]
+
+    @pytest.mark.asyncio
+    async def test_df_drop_rows_labels_changed_by_cast(self, interp):
+        """Test DF.DROP-ROWS doesn't truncate float or boolean labels onto an int index."""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        interp.stack_push(df)
+        await interp.run("[1.5 TRUE] pd.DF.DROP-ROWS")
+
+        result = interp.stack_pop()
+        assert result["a"].tolist() == [1, 2, 3]
+
+        interp.stack_push(df)
+        await interp.run("[1.0] pd.DF.DROP-ROWS")
+
+        result = interp.stack_pop()
+        assert result["a"].tolist() == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_df_drop_rows_uncastable_labels(self, interp):
+        """Test DF.DROP-ROWS ignores labels that can't be cast to the index dtype."""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        interp.stack_push(df)
+        await interp.run("[1 'missing'] pd.DF.DROP-ROWS")
+
+        result = interp.stack_pop()
+        assert result["a"].tolist() == [1, 3]
+
     @pytest.mark.asyncio
     async def test_df_append_row(self, interp, sample_df):
         """Test DF.APPEND-ROW adds a row to DataFrame."""
@@ -683,6 +1005,38 @@ class TestRowOperations:
         assert len(result) == 1
         assert result.iloc[0]["name"] == "Alice"
 
+    @pytest.mark.asyncio
+    async def test_df_extend_rows(self, interp, sample_df):
+        """Test DF.EXTEND-ROWS matches repeated DF.APPEND-ROW."""
+        interp.stack_push(sample_df)
+        await interp.run("""
+            [
+                [['name' 'Eve'] ['age' 32]] REC
+                [['name' 'Frank'] ['city' 'Denver']] REC
+            ] pd.DF.EXTEND-ROWS
+        """)
+        extended = interp.stack_pop()
+
+        interp.stack_push(sample_df)
+        await interp.run("""
+            [['name' 'Eve'] ['age' 32]] REC pd.DF.APPEND-ROW
+            [['name' 'Frank'] ['city' 'Denver']] REC pd.DF.APPEND-ROW
+        """)
+        appended = interp.stack_pop()
+
+        pd.testing.assert_frame_equal(extended, appended)
+        assert extended.index.tolist() == [0, 1, 2, 3, 4, 5]
+        assert extended.iloc[5]["city"] == "Denver"
+
+    @pytest.mark.asyncio
+    async def test_df_extend_rows_empty_list(self, interp, sample_df):
+        """Test DF.EXTEND-ROWS with no rows returns DataFrame unchanged."""
+        interp.stack_push(sample_df)
+        await interp.run("[] pd.DF.EXTEND-ROWS")
+
+        result = interp.stack_pop()
+        assert result is sample_df
+
     @pytest.mark.asyncio
     async def test_df_sample_default(self, interp, sample_df):
         """Test DF.SAMPLE returns 1 row by default."""
@@ -766,6 +1120,36 @@ class TestAggregationOperations:
         assert hasattr(grouped, 'groups')
         assert len(grouped.groups) == 4
 
+    @pytest.mark.asyncio
+    async def test_df_group_by_categorical_keys(self, interp):
+        """Test DF.GROUP-BY with .categorical TRUE groups repetitive string keys as categoricals."""
+        df = pd.DataFrame({
+            'city': ['NYC', 'LA', 'NYC', 'LA', 'NYC', 'SF', 'LA'],
+            'salary': [70000, 65000, 80000, 75000, 90000, 60000, 50000]
+        })
+        interp.stack_push(df)
+        await interp.run("'city' [.categorical TRUE] ~> pd.DF.GROUP-BY 'sum' pd.DF.AGG")
+
+        result = interp.stack_pop()
+        assert result['salary'].to_dict() == {'LA': 190000, 'NYC': 240000, 'SF': 60000}
+        assert isinstance(result.index, pd.CategoricalIndex)
+        # The caller's DataFrame is not modified
+        assert df['city'].dtype == object
+
+    @pytest.mark.asyncio
+    async def test_df_group_by_keeps_key_dtype(self, interp):
+        """Test DF.GROUP-BY keeps the original key dtype by default."""
+        df = pd.DataFrame({
+            'city': ['NYC', 'LA', 'NYC', 'LA'],
+            'salary': [70000, 65000, 80000, 75000]
+        })
+        interp.stack_push(df)
+        await interp.run("'city' pd.DF.GROUP-BY 'sum' pd.DF.AGG")
+
+        result = interp.stack_pop()
+        assert result['salary'].to_dict() == {'LA': 140000, 'NYC': 150000}
+        assert not isinstance(result.index, pd.CategoricalIndex)
+
     @pytest.mark.asyncio
     async def test_df_agg_with_function_name(self, interp, sample_df):
         """Test DF.AGG with function name."""
@@ -775,6 +1159,34 @@ class TestAggregationOperations:
         result = interp.stack_pop()
         assert isinstance(result, pd.DataFrame)
 
+    @pytest.mark.asyncio
+    async def test_df_agg_with_engine(self, interp):
+        """Test DF.AGG forwards .engine to grouped reductions."""
+        df = pd.DataFrame({'city': ['NYC', 'LA', 'NYC'], 'salary': [70000, 65000, 80000]})
+        interp.stack_push(df)
+        await interp.run("'city' pd.DF.GROUP-BY 'sum' [.engine 'cython'] ~> pd.DF.AGG")
+
+        result = interp.stack_pop()
+        assert result['salary'].to_dict() == {'LA': 65000, 'NYC': 150000}
+
+        interp.stack_push(df)
+        with pytest.raises(Exception, match="requires a grouped DataFrame"):
+            await interp.run("'sum' [.engine 'cython'] ~> pd.DF.AGG")
+
+    @pytest.mark.asyncio
+    async def test_df_agg_numba_engine_requires_numba(self, interp):
+        """Test DF.AGG with .engine 'numba' explains the missing dependency."""
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("numba is installed")
+
+        interp.stack_push(pd.DataFrame({'k': ['a', 'b'], 'v': [1, 2]}))
+        with pytest.raises(Exception, match="requires numba"):
+            await interp.run("'k' pd.DF.GROUP-BY 'sum' [.engine 'numba'] ~> pd.DF.AGG")
+
     @pytest.mark.asyncio
     async def test_df_agg_with_dict(self, interp, sample_df):
         """Test DF.AGG with dict of aggregations."""
@@ -822,6 +1234,15 @@ class TestAggregationOperations:
         assert result['a'] == 2.0
         assert result['b'] == 5.0
 
+    @pytest.mark.asyncio
+    async def test_df_mean_numeric_only(self, interp, sample_df):
+        """Test DF.MEAN with .numeric_only skips string columns."""
+        interp.stack_push(sample_df)
+        await interp.run("[.numeric_only TRUE] ~> pd.DF.MEAN")
+
+        result = interp.stack_pop()
+        assert result.to_dict() == {'age': 29.5}
+
     @pytest.mark.asyncio
     async def test_df_median(self, interp):
         """Test DF.MEDIAN."""
@@ -948,6 +1369,49 @@ class TestStatisticalOperations:
         result = interp.stack_pop()
         assert isinstance(result, pd.DataFrame)
 
+    @pytest.mark.asyncio
+    async def test_df_corr_and_cov_float32(self, interp):
+        """Test DF.CORR / DF.COV with .dtype 'float32' match float64 results."""
+        df = pd.DataFrame({
+            'a': [1, 2, 3, 4, 5],
+            'b': [2, 4, 6, 8, 11],
+            'c': [1, 3, 2, 4, 3],
+            'k': [7, 7, 7, 7, 7]
+        })
+        interp.stack_push(df)
+        await interp.run("[.dtype 'float32'] ~> pd.DF.CORR")
+
+        result = interp.stack_pop()
+        assert result.dtypes.unique().tolist() == [np.float32]
+        pd.testing.assert_frame_equal(result, df.corr(), check_dtype=False, atol=1e-6)
+
+        interp.stack_push(df)
+        await interp.run("[.dtype 'float32'] ~> pd.DF.COV")
+
+        result = interp.stack_pop()
+        pd.testing.assert_frame_equal(result, df.cov(), check_dtype=False, atol=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_df_corr_float32_with_missing_values(self, interp):
+        """Test DF.CORR .dtype falls back to pandas' pairwise handling of NaN."""
+        df = pd.DataFrame({'a': [1, 2, None, 4, 5], 'b': [2, 4, 6, None, 10]})
+        interp.stack_push(df)
+        await interp.run("[.dtype 'float32'] ~> pd.DF.CORR")
+
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.corr())
+
+    @pytest.mark.asyncio
+    async def test_df_corr_and_cov_integer_dtype(self, interp):
+        """Test DF.CORR/DF.COV with a non-float .dtype fall back to pandas."""
+        df = pd.DataFrame({'a': [1, 2, 3, 4, 5], 'b': [2, 4, 5, 8, 10]})
+        interp.stack_push(df)
+        await interp.run("[.dtype 'int64'] ~> pd.DF.COV")
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.cov())
+
+        interp.stack_push(df)
+        await interp.run("[.dtype 'int64'] ~> pd.DF.CORR")
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.corr())
+
     @pytest.mark.asyncio
     async def test_df_cov(self, interp):
         """Test DF.COV."""
@@ -1332,6 +1796,114 @@ class TestFileIOOperations:
         result = interp.stack_pop()
         assert result['a'].tolist() == [1, 2]
 
+    @pytest.mark.asyncio
+    async def test_file_io_runs_off_event_loop(self, interp, tmp_path, monkeypatch):
+        """Test READ_CSV parses in a worker thread, leaving the event loop free."""
+        import threading
+
+        for name in ["pd.READ_CSV", "pd.READ_EXCEL", "pd.READ_JSON", "pd.TO_CSV", "pd.TO_JSON"]:
+            assert interp.find_word(name).target_word.is_async is True
+
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({'a': [1, 2, 3]}).to_csv(csv_file, index=False)
+
+        # The read waits for a coroutine that can only run if the loop isn't blocked
+        loop_ran = threading.Event()
+        read_csv = pd.read_csv
+
+        def slow_read_csv(*args, **kwargs):
+            assert loop_ran.wait(timeout=5)
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(pd, "read_csv", slow_read_csv)
+
+        async def mark_loop_ran():
+            await asyncio.sleep(0)
+            loop_ran.set()
+
+        interp.stack_push(str(csv_file))
+        await asyncio.gather(interp.run("pd.READ_CSV"), mark_loop_ran())
+
+        assert interp.stack_pop()['a'].tolist() == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_read_csv_memory_maps_local_files(self, interp, tmp_path, monkeypatch):
+        """Test READ_CSV memory-maps non-empty local files unless told otherwise."""
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({'a': [1, 2]}).to_csv(csv_file, index=False)
+        empty_file = tmp_path / "empty.csv"
+        empty_file.write_text("")
+
+        calls = []
+        read_csv = pd.read_csv
+
+        def spy_read_csv(*args, **kwargs):
+            calls.append(kwargs.get("memory_map"))
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(pd, "read_csv", spy_read_csv)
+
+        interp.stack_push(str(csv_file))
+        await interp.run("pd.READ_CSV")
+        assert interp.stack_pop()['a'].tolist() == [1, 2]
+
+        interp.stack_push(str(csv_file))
+        await interp.run("[.memory_map FALSE] ~> pd.READ_CSV")
+        interp.stack_pop()
+
+        # An empty file still raises pandas' EmptyDataError rather than an mmap error
+        interp.stack_push(str(empty_file))
+        with pytest.raises(pd.errors.EmptyDataError):
+            await interp.run("pd.READ_CSV")
+
+        assert calls == [True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_read_csv_chunksize(self, interp, tmp_path):
+        """Test READ_CSV with .chunksize still returns a single DataFrame."""
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({'a': range(5), 'b': list('vwxyz')}).to_csv(csv_file, index=False)
+
+        interp.stack_push(str(csv_file))
+        await interp.run("[.chunksize 2] ~> pd.READ_CSV")
+
+        result = interp.stack_pop()
+        assert isinstance(result, pd.DataFrame)
+        assert result.index.tolist() == [0, 1, 2, 3, 4]
+        assert result['a'].tolist() == [0, 1, 2, 3, 4]
+        assert result['b'].tolist() == list('vwxyz')
+
+    @pytest.mark.asyncio
+    async def test_read_csv_pyarrow_engine(self, interp, tmp_path):
+        """Test READ_CSV with .engine 'pyarrow' reads through Arrow."""
+        pytest.importorskip("pyarrow")
+        tsv_file = tmp_path / "test.tsv"
+        pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}).to_csv(tsv_file, sep='\t', index=False)
+
+        interp.stack_push(str(tsv_file))
+        await interp.run("[.engine 'pyarrow' .sep '\t'] ~> pd.READ_CSV")
+
+        result = interp.stack_pop()
+        assert result['a'].tolist() == [1, 2]
+        assert result['b'].tolist() == ['x', 'y']
+
+    @pytest.mark.asyncio
+    async def test_read_csv_pyarrow_engine_missing(self, interp, tmp_path):
+        """Test READ_CSV with .engine 'pyarrow' explains the missing dependency."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("pyarrow is installed")
+
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({'a': [1, 2]}).to_csv(csv_file, index=False)
+
+        interp.stack_push(str(csv_file))
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            await interp.run("[.engine 'pyarrow'] ~> pd.READ_CSV")
+
     @pytest.mark.asyncio
     async def test_read_excel_and_to_excel(self, interp, tmp_path):
         """Test READ_EXCEL and TO_EXCEL."""
@@ -1399,6 +1971,41 @@ class TestFileIOOperations:
         assert ';' in content
         assert 'a' not in content  # No header
 
+    @pytest.mark.asyncio
+    async def test_read_parquet_and_to_parquet(self, interp, tmp_path):
+        """Test TO_PARQUET and READ_PARQUET round-trip column types."""
+        pytest.importorskip("pyarrow")
+        parquet_file = tmp_path / "test.parquet"
+        df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y'], 'c': [0.5, 1.5]})
+
+        interp.stack_push(df)
+        interp.stack_push(str(parquet_file))
+        await interp.run("pd.TO_PARQUET")
+
+        interp.stack_push(str(parquet_file))
+        await interp.run("[.columns ['a' 'c']] ~> pd.READ_PARQUET")
+
+        result = interp.stack_pop()
+        assert result.columns.tolist() == ['a', 'c']
+        assert result['a'].dtype == np.int64
+        assert result['c'].tolist() == [0.5, 1.5]
+
+    @pytest.mark.asyncio
+    async def test_to_parquet_requires_engine(self, interp, tmp_path):
+        """Test TO_PARQUET raises ImportError without a Parquet engine."""
+        for engine in ["pyarrow", "fastparquet"]:
+            try:
+                __import__(engine)
+            except ImportError:
+                pass
+            else:
+                pytest.skip(f"{engine} is installed")
+
+        interp.stack_push(pd.DataFrame({'a': [1]}))
+        interp.stack_push(str(tmp_path / "test.parquet"))
+        with pytest.raises(ImportError, match="pyarrow or fastparquet"):
+            await interp.run("pd.TO_PARQUET")
+
     @pytest.mark.asyncio
     async def test_read_excel_with_sheet_name(self, interp, tmp_path):
         """Test READ_EXCEL with specific sheet name."""
@@ -1440,6 +2047,64 @@ class TestTransformationOperations:
         assert result['a'].tolist() == [2, 4, 6]
         assert result['b'].tolist() == [8, 10, 12]
 
+    @pytest.mark.asyncio
+    async def test_df_map_runs_per_value(self, interp):
+        """Test DF.MAP gives each element to the code, not the whole column."""
+        interp.stack_push(pd.DataFrame({'s': ['x', None, 'y']}))
+        await interp.run("'NULL ==' pd.DF.MAP")
+
+        assert interp.stack_pop()['s'].tolist() == [False, True, False]
+
+    @pytest.mark.asyncio
+    async def test_df_map_to_strings(self, interp):
+        """Test DF.MAP with code that changes the column type."""
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+        interp.stack_push(df)
+        await interp.run("'>STR' pd.DF.MAP")
+
+        result = interp.stack_pop()
+        assert result['a'].tolist() == ['1', '2', '3']
+        assert result['b'].tolist() == ['4', '5', '6']
+        # The input DataFrame is left unchanged
+        assert df['a'].tolist() == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_df_map_batched(self, interp):
+        """Test DF.MAP with .batched runs the code once per column on a list."""
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']}, index=[4, 5, 6])
+        interp.stack_push(df)
+        await interp.run("'\"DUP +\" MAP' [.batched TRUE] ~> pd.DF.MAP")
+
+        result = interp.stack_pop()
+        assert result.index.tolist() == [4, 5, 6]
+        assert result['a'].tolist() == [2, 4, 6]
+        assert result['a'].dtype == np.int64
+        assert result['b'].tolist() == ['xx', 'yy', 'zz']
+
+    @pytest.mark.asyncio
+    async def test_df_map_batched_wrong_length(self, interp):
+        """Test DF.MAP with .batched rejects code that changes the column length."""
+        interp.stack_push(pd.DataFrame({'a': [1, 2, 3]}))
+
+        with pytest.raises(Exception, match="must return 3 values.*got int$"):
+            await interp.run("'LENGTH' [.batched TRUE] ~> pd.DF.MAP")
+
+        interp.stack_push(pd.DataFrame({'a': [1, 2, 3]}))
+        with pytest.raises(Exception, match="must return 3 values.*got list of length 2$"):
+            await interp.run("'2 TAKE' [.batched TRUE] ~> pd.DF.MAP")
+
+    @pytest.mark.asyncio
+    async def test_df_map_keeps_duplicate_labels(self, interp):
+        """Test DF.MAP keeps duplicate column labels and a duplicated index."""
+        df = pd.DataFrame([[1, 'x'], [2, 'y']], columns=['a', 'a'], index=[5, 5])
+        interp.stack_push(df)
+        await interp.run("'>STR' pd.DF.MAP")
+
+        result = interp.stack_pop()
+        assert result.columns.tolist() == ['a', 'a']
+        assert result.index.tolist() == [5, 5]
+        assert result.values.tolist() == [['1', 'x'], ['2', 'y']]
+
     @pytest.mark.asyncio
     async def test_df_apply_to_rows(self, interp, sample_df):
         """Test DF.APPLY with axis=1 (rows)."""
@@ -1450,6 +2115,33 @@ class TestTransformationOperations:
         assert isinstance(result, pd.Series)
         assert result.tolist() == [30, 25, 35, 28]
 
+    @pytest.mark.asyncio
+    async def test_df_apply_rows_keep_column_types(self, interp):
+        """Test DF.APPLY row records carry each column's own value type."""
+        df = pd.DataFrame({'n': [1, 2], 'x': [0.5, 1.5]})
+        interp.stack_push(df)
+        # iterrows() would have upcast n to float in this mixed frame ("1.0")
+        await interp.run("'\"n\" REC@ >STR' [.axis 1] ~> pd.DF.APPLY")
+
+        result = interp.stack_pop()
+        assert result.tolist() == ['1', '2']
+
+    @pytest.mark.asyncio
+    async def test_df_apply_to_columns(self, interp):
+        """Test DF.APPLY with axis=0 runs the code once per column."""
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [4.5, 5.5, 6.5]})
+        interp.stack_push(df)
+        await interp.run("""
+            0 'n' VARIABLES  n !
+            'n @ 1 + n ! pd.DF.SUM' [.axis 0] ~> pd.DF.APPLY
+        """)
+
+        result = interp.stack_pop()
+        assert isinstance(result, pd.Series)
+        assert result.tolist() == [6, 16.5]
+        await interp.run("n @")
+        assert interp.stack_pop() == 2
+
     @pytest.mark.asyncio
     async def test_df_transform(self, interp):
         """Test DF.TRANSFORM with function name."""
@@ -1463,6 +2155,22 @@ class TestTransformationOperations:
         assert abs(result['a'].iloc[0] - 1.0) < 0.01
         assert abs(result['a'].iloc[1] - math.sqrt(2)) < 0.01
 
+    @pytest.mark.asyncio
+    async def test_df_transform_grouped_with_engine(self, interp):
+        """Test DF.TRANSFORM broadcasts grouped reductions and forwards .engine."""
+        df = pd.DataFrame({'city': ['NYC', 'LA', 'NYC'], 'salary': [70000, 65000, 80000]})
+        interp.stack_push(df)
+        await interp.run("'city' pd.DF.GROUP-BY 'sum' pd.DF.TRANSFORM")
+        interp.stack_push(df)
+        await interp.run("'city' pd.DF.GROUP-BY 'sum' [.engine 'cython'] ~> pd.DF.TRANSFORM")
+
+        assert interp.stack_pop()['salary'].tolist() == [150000, 65000, 150000]
+        assert interp.stack_pop()['salary'].tolist() == [150000, 65000, 150000]
+
+        interp.stack_push(df)
+        with pytest.raises(Exception, match="requires a grouped DataFrame"):
+            await interp.run("'sum' [.engine 'cython'] ~> pd.DF.TRANSFORM")
+
     @pytest.mark.asyncio
     async def test_df_reset_index(self, interp):
         """Test DF.RESET-INDEX."""
@@ -1504,6 +2212,29 @@ class TestTransformationOperations:
         result = interp.stack_pop()
         assert 'name' in result.columns  # Name column kept
 
+    @pytest.mark.asyncio
+    async def test_df_set_and_reset_index_match_pandas(self, interp):
+        """Test DF.SET-INDEX and DF.RESET-INDEX match pandas and leave the input alone."""
+        df = pd.DataFrame(
+            {'k': pd.to_datetime(['2024-01-02', '2024-01-01']), 'v': [1.5, 2.5]}, index=[7, 9]
+        )
+        interp.stack_push(df)
+        await interp.run("'k' pd.DF.SET-INDEX")
+        interp.stack_push(df)
+        await interp.run("[.drop TRUE] ~> pd.DF.RESET-INDEX")
+
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.reset_index(drop=True))
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.set_index('k'))
+        assert df.columns.tolist() == ['k', 'v']
+        assert df.index.tolist() == [7, 9]
+
+    @pytest.mark.asyncio
+    async def test_df_set_index_verify_integrity(self, interp):
+        """Test DF.SET-INDEX with .verify_integrity rejects duplicate keys."""
+        interp.stack_push(pd.DataFrame({'k': [1, 1], 'v': [2, 3]}))
+        with pytest.raises(Exception, match="duplicate"):
+            await interp.run("'k' [.verify_integrity TRUE] ~> pd.DF.SET-INDEX")
+
     @pytest.mark.asyncio
     async def test_df_transpose(self, interp):
         """Test DF.TRANSPOSE."""
@@ -1539,6 +2270,18 @@ class TestTransformationOperations:
         assert len(result) == 4  # Exploded from 2 to 4 rows
         assert result['a'].tolist() == [1, 2, 3, 4]
 
+    @pytest.mark.asyncio
+    async def test_df_explode_matches_pandas(self, interp):
+        """Test DF.EXPLODE handles empty lists, scalars and a duplicated index like pandas."""
+        df = pd.DataFrame(
+            {'a': [[1, 2], [], np.nan, 5], 'b': pd.Categorical(['w', 'x', 'y', 'z'])},
+            index=[3, 3, 'q', 1],
+        )
+        interp.stack_push(df)
+        await interp.run("'a' pd.DF.EXPLODE")
+
+        pd.testing.assert_frame_equal(interp.stack_pop(), df.explode('a'))
+
     @pytest.mark.asyncio
     async def test_df_replace(self, interp):
         """Test DF.REPLACE."""
@@ -1666,6 +2409,25 @@ class TestStringOperations:
         result = interp.stack_pop()
         assert result.tolist() == ['hello', 'world']
 
+    @pytest.mark.asyncio
+    async def test_str_case_and_strip_keep_labels_and_missing(self, interp):
+        """Test STR.UPPER/LOWER/STRIP keep the index, name and missing values."""
+        series = pd.Series([' Ab ', 'cD'], index=[7, 3], name='s')
+        with_missing = pd.Series([' Ab ', None, np.nan])
+        for word, expected in [("UPPER", [' AB ', 'CD']), ("LOWER", [' ab ', 'cd']), ("STRIP", ['Ab', 'cD'])]:
+            interp.stack_push(series)
+            await interp.run(f"pd.STR.{word}")
+            result = interp.stack_pop()
+            assert result.tolist() == expected
+            assert result.index.tolist() == [7, 3]
+            assert result.name == 's'
+
+            interp.stack_push(with_missing)
+            await interp.run(f"pd.STR.{word}")
+            result = interp.stack_pop()
+            assert result.iloc[0] == expected[0]
+            assert result.iloc[1:].isna().all()
+
     @pytest.mark.asyncio
     async def test_str_contains(self, interp):
         """Test STR.CONTAINS."""
@@ -1686,6 +2448,18 @@ class TestStringOperations:
         result = interp.stack_pop()
         assert result.tolist() == [True, False]
 
+    @pytest.mark.asyncio
+    async def test_str_contains_literal_and_regex(self, interp):
+        """Test STR.CONTAINS matches literal and regex patterns alike."""
+        series = pd.Series(['a b', 'a.b', None, 'axb'])
+        interp.stack_push(series)
+        await interp.run("'a b' pd.STR.CONTAINS")
+        interp.stack_push(series)
+        await interp.run("'a.b' pd.STR.CONTAINS")
+
+        assert interp.stack_pop().tolist() == [True, True, False, True]
+        assert interp.stack_pop().tolist() == [True, False, False, False]
+
     @pytest.mark.asyncio
     async def test_str_split(self, interp):
         """Test STR.SPLIT."""
@@ -1706,6 +2480,18 @@ class TestStringOperations:
         result = interp.stack_pop()
         assert result.tolist() == ['hello there', 'goodbye there']
 
+    @pytest.mark.asyncio
+    async def test_str_replace_regex_and_backrefs(self, interp):
+        """Test STR.REPLACE still treats patterns and group references as regex."""
+        series = pd.Series(['a1', 'b2'])
+        interp.stack_push(series)
+        await interp.run("'[0-9]' '#' pd.STR.REPLACE")
+        interp.stack_push(series)
+        await interp.run("'(a)' '\\1\\1' pd.STR.REPLACE")
+
+        assert interp.stack_pop().tolist() == ['aa1', 'b2']
+        assert interp.stack_pop().tolist() == ['a#', 'b#']
+
     @pytest.mark.asyncio
     async def test_str_extract(self, interp):
         """Test STR.EXTRACT."""